@@ -0,0 +1,232 @@
+import glob
+import os
+import sys
+import timeit
+
+import pandas as pd
+
+from swiggy import columnBuffer
+from swiggy import columnWidths
+from swiggy import dishExtractor
+from swiggy import pipeline
+from swiggy import textCleaning
+
+# Micro-benchmarks for the parsing pipeline, run against the recorded SwiggyData runs.
+#
+# The SwiggyData-*.xlsx workbooks are turned back into search/v3 shaped responses
+# (one per sheet), so the benchmarks need no network access. Usage:
+#     python benchmarks.py            # run every benchmark
+#     python benchmarks.py extract    # run one by name
+
+RECORDED_RUNS = "SwiggyData-*.xlsx"
+
+
+def _value(row, column, default):
+    value = row.get(column, default)
+    return default if pd.isna(value) else value
+
+
+def load_recorded_responses(pattern=RECORDED_RUNS):
+    """Rebuilds one search/v3 style response per sheet of the recorded SwiggyData workbooks"""
+    responses = []
+    for file_path in sorted(glob.glob(pattern)):
+        if os.path.getsize(file_path) == 0:
+            continue  # Workbook from a run that crashed before saving
+        for sheet_name, df in pd.read_excel(file_path, sheet_name=None).items():
+            dish_cards = []
+            for row in df.to_dict(orient="records"):
+                total_ratings = _value(row, "Total Ratings", 0)
+                dish_cards.append({"card": {"card": {
+                    "info": {
+                        "name": _value(row, "Dish Name", "N/A"),
+                        "category": _value(row, "Category", "N/A"),
+                        "description": _value(row, "Description", "N/A"),
+                        "price": int(float(_value(row, "Price (₹)", 0)) * 100),
+                        "ratings": {"aggregatedRating": {"rating": str(_value(row, "Rating", "N/A"))}},
+                    },
+                    "restaurant": {"info": {
+                        "name": _value(row, "Restaurant Name", "N/A"),
+                        "locality": _value(row, "Locality", "N/A"),
+                        "areaName": _value(row, "Area Name", "N/A"),
+                        "costForTwoMessage": _value(row, "costForTwoMessage", "N/A"),
+                        "cuisines": str(_value(row, "Cuisine", "")).split(", "),
+                        "totalRatingsString": f"{int(total_ratings) / 1000:g}K+" if total_ratings else "0",
+                        "aggregatedDiscountInfoV3": {
+                            "header": _value(row, "Discount", "N/A"),
+                            "subHeader": _value(row, "Discount Details", "N/A"),
+                            "discountTag": _value(row, "Discount Type", "N/A"),
+                        },
+                    }},
+                }}})
+            responses.append({"data": {"cards": [{"card": {}}, {"groupedCard": {"cardGroupMap": {"DISH": {"cards": dish_cards}}}}]}})
+    return responses
+
+
+def legacy_parse(data):
+    """The nested .get() walk swiggyAutomation.py used before the declarative extractor"""
+    cards = data.get("data", {}).get("cards", [])
+    dish_cards = []
+    for card in cards:
+        if "groupedCard" in card:
+            dish_cards = card["groupedCard"].get("cardGroupMap", {}).get("DISH", {}).get("cards", [])
+            break
+
+    dish_data = []
+    for dish_card in dish_cards:
+        dish_info = dish_card.get("card", {}).get("card", {}).get("info", {})
+        restaurant_info = dish_card.get("card", {}).get("card", {}).get("restaurant", {}).get("info", {})
+        if dish_info:
+            dish_data.append({
+                "Dish Name": dish_info.get("name", "N/A"),
+                "Rating": dish_info.get("ratings", {}).get("aggregatedRating", {}).get("rating", "N/A"),
+                "Restaurant Name": restaurant_info.get("name", "N/A"),
+                "Total Ratings": dishExtractor.convert_total_ratings(restaurant_info.get("totalRatingsString", "0")),
+                "Price (₹)": dish_info.get("price", 0) / 100,
+                "Locality": restaurant_info.get("locality", "N/A"),
+                "Category": dish_info.get("category", "N/A"),
+                "costForTwoMessage": restaurant_info.get("costForTwoMessage", "N/A"),
+                "Description": dish_info.get("description", "N/A"),
+                "Area Name": restaurant_info.get("areaName", "N/A"),
+                "Cuisine": ", ".join(restaurant_info.get("cuisines", [])),
+                "Discount": restaurant_info.get("aggregatedDiscountInfoV3", {}).get("header", "N/A"),
+                "Discount Details": restaurant_info.get("aggregatedDiscountInfoV3", {}).get("subHeader", "N/A"),
+                "Discount Type": restaurant_info.get("aggregatedDiscountInfoV3", {}).get("discountTag", "N/A"),
+            })
+    return dish_data
+
+
+def legacy_parse_columns():
+    """Columns legacy_parse() produces, in order"""
+    card = {"card": {"card": {"info": {"name": "x"}}}}
+    return legacy_parse({"data": {"cards": [{"groupedCard": {"cardGroupMap": {"DISH": {"cards": [card]}}}}]}})[0].keys()
+
+
+def _report(name, legacy_seconds, new_seconds, rows):
+    print(f"{name}: {rows} rows | legacy {legacy_seconds * 1000:.1f} ms | new {new_seconds * 1000:.1f} ms | {legacy_seconds / new_seconds:.1f}x")
+
+
+def bench_extract(responses, repeat=5):
+    """
+    One keyword's response to its deduplicated DataFrame, as each script did it:
+    nested .get() walk + list of dicts + DataFrame + concat + drop_duplicates vs
+    extractor into column buffers + dedup on append + one typed DataFrame per query.
+    """
+    # Only swiggyAutomation.py's original columns; the legacy parser never produced the others
+    legacy_columns = list(legacy_parse_columns())
+    extractor = dishExtractor.DishExtractor([field for field in dishExtractor.DISH_FIELDS if field[0] in legacy_columns])
+
+    def legacy_query(data):
+        merged_df = pd.concat([pd.DataFrame(legacy_parse(data))], ignore_index=True)  # One location per recorded query
+        return merged_df.drop_duplicates(subset=pipeline.DEDUP_COLUMNS, keep="first")
+
+    def new_query(data):
+        query_buffer = columnBuffer.DedupBuffer(extractor.columns, dishExtractor.DISH_COLUMN_TYPES,
+                                                key_columns=pipeline.DEDUP_COLUMNS)
+        location_buffer = columnBuffer.ColumnBuffer(extractor.columns, dishExtractor.DISH_COLUMN_TYPES)
+        extractor.extract(data, columns=location_buffer.columns)
+        query_buffer.append(location_buffer)
+        return pipeline.to_frame(query_buffer)
+
+    # Both paths must produce the same frame
+    for data in responses:
+        expected = legacy_query(data).reset_index(drop=True)
+        actual = new_query(data)
+        if not expected.empty or not actual.empty:
+            pd.testing.assert_frame_equal(expected, actual)
+
+    legacy = min(timeit.repeat(lambda: [legacy_query(data) for data in responses], number=1, repeat=repeat))
+    new = min(timeit.repeat(lambda: [new_query(data) for data in responses], number=1, repeat=repeat))
+    _report("extract", legacy, new, sum(len(legacy_parse(data)) for data in responses))
+
+
+def bench_clean(responses, repeat=5):
+    """Per-cell df.map(clean_text) vs clean_dataframe(), per recorded sheet and on all sheets combined"""
+    extractor = dishExtractor.DishExtractor(dishExtractor.DISH_FIELDS)
+    frames = [pd.DataFrame(extractor.extract(data)) for data in responses]
+    # Sprinkle in some control characters so both paths have work to do
+    for df in frames:
+        df.loc[df.index[::7], "Description"] = df["Description"][::7] + "\x0b\x1f"
+
+    for label, sheets in (("clean (per sheet)", frames), ("clean (one large sheet)", [pd.concat(frames, ignore_index=True)])):
+        for df in sheets:
+            expected = df.map(textCleaning.clean_text)
+            actual, _ = textCleaning.clean_dataframe(df.copy())
+            pd.testing.assert_frame_equal(expected, actual)
+
+        legacy = min(timeit.repeat(lambda: [df.map(textCleaning.clean_text) for df in sheets], number=1, repeat=repeat))
+        new = min(timeit.repeat(lambda: [textCleaning.clean_dataframe(df.copy()) for df in sheets], number=1, repeat=repeat))
+        _report(label, legacy, new, sum(len(df) for df in sheets))
+
+
+def bench_ratings(responses, repeat=5):
+    """Row-by-row convert_total_ratings vs the factorized, memoized column converter (equivalence: tests/test_dishExtractor.py)"""
+    extractor = dishExtractor.DishExtractor(dishExtractor.DISH_FIELDS)
+    ratings = pd.concat([pd.Series(extractor.extract(data)["Total Ratings"], dtype=object) for data in responses], ignore_index=True)
+    dishExtractor.convert_total_ratings_series(ratings)  # Warm the memo, as a long sweep would
+
+    legacy = min(timeit.repeat(lambda: ratings.map(dishExtractor.convert_total_ratings), number=1, repeat=repeat))
+    new = min(timeit.repeat(lambda: dishExtractor.convert_total_ratings_series(ratings), number=1, repeat=repeat))
+    _report("ratings", legacy, new, len(ratings))
+
+
+def legacy_adjust_column_width(sheet):
+    """The cell-by-cell width scan adjust_column_width used before columnWidths"""
+    from openpyxl.utils import get_column_letter
+
+    for col_idx, col_cells in enumerate(sheet.columns, start=1):
+        max_length = 0
+        col_letter = get_column_letter(col_idx)
+        for cell in col_cells:
+            if cell.value:
+                max_length = max(max_length, len(str(cell.value)))
+        sheet.column_dimensions[col_letter].width = max_length * 3 if col_letter == "D" else max_length + 5
+
+
+def bench_widths(responses, repeat=3):
+    """Cell-by-cell width scan of the written sheets vs DataFrame-based sizing (exact and sampled)"""
+    from openpyxl import Workbook
+    from openpyxl.utils.dataframe import dataframe_to_rows
+
+    extractor = dishExtractor.DishExtractor(dishExtractor.DISH_FIELDS)
+    frames = [pd.DataFrame(extractor.extract(data)) for data in responses]
+    workbook = Workbook()
+    sheets = []
+    for df in frames:
+        sheet = workbook.create_sheet()
+        for row in dataframe_to_rows(df, index=False, header=True):
+            sheet.append(row)
+        sheets.append(sheet)
+
+    legacy = min(timeit.repeat(lambda: [legacy_adjust_column_width(sheet) for sheet in sheets], number=1, repeat=repeat))
+
+    # Every sheet is measured; one sizer per run, as the Excel sinks use it
+    def size_sheets(sample_size):
+        sizer = columnWidths.ColumnWidthSizer(sample_size=sample_size)
+        return [sizer.widths(df) for df in frames]
+
+    # Exact sizing must match the cell walk (capped at Excel's limit)
+    for sheet, widths in zip(sheets, size_sheets(None)):
+        expected = {letter: min(dimension.width, columnWidths.MAX_COLUMN_WIDTH) for letter, dimension in sheet.column_dimensions.items()}
+        assert widths == expected
+
+    exact = min(timeit.repeat(lambda: size_sheets(None), number=1, repeat=repeat))
+    sampled = min(timeit.repeat(lambda: size_sheets(columnWidths.SAMPLE_SIZE), number=1, repeat=repeat))
+    rows = sum(len(df) for df in frames)
+    _report("widths (exact)", legacy, exact, rows)
+    _report(f"widths (sample of {columnWidths.SAMPLE_SIZE} rows)", legacy, sampled, rows)
+
+
+BENCHMARKS = {
+    "extract": bench_extract,
+    "clean": bench_clean,
+    "ratings": bench_ratings,
+    "widths": bench_widths,
+}
+
+
+if __name__ == "__main__":
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    recorded = load_recorded_responses()
+    print(f"📦 Loaded {len(recorded)} recorded responses from {RECORDED_RUNS}")
+    for name in selected:
+        BENCHMARKS[name](recorded)
@@ -0,0 +1,37 @@
+import importlib
+
+# Swiggy dish scraper.
+#
+#     import swiggy
+#     data = swiggy.fetch(17.4875, 78.3953, "French Fries")
+#     df = swiggy.parse_frame(data)
+#     swiggy.write({"French Fries": df}, formats=["parquet"])
+#     swiggy.run(swiggy.SweepOptions(output_mode="delta"))
+#
+# or, from a shell: python -m swiggy --help
+#
+# The API names below are resolved on first use, so "import swiggy" itself does
+# not load pandas, requests or any of the output libraries.
+
+_API = {
+    "SweepOptions": "pipeline",
+    "SweepRun": "pipeline",
+    "SwiggyClient": "pipeline",
+    "fetch": "pipeline",
+    "parse": "pipeline",
+    "parse_frame": "pipeline",
+    "to_frame": "pipeline",
+    "write": "pipeline",
+    "run": "pipeline",
+}
+
+__all__ = list(_API)
+
+
+def __getattr__(name):
+    module_name = _API.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
@@ -0,0 +1,35 @@
+import argparse
+
+# Command line entry point: python -m swiggy [options]
+#
+# Every option falls back to its SWIGGY_* environment variable, and then to the
+# defaults the original swiggyAutomation.py script used.
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m swiggy", description="Scrape Swiggy dish search results for every keyword × location.")
+    parser.add_argument("--keywords", dest="keywords_path", help="Keyword file (.xlsx, .csv, .yaml, .json); default Book2.xlsx")
+    parser.add_argument("--locations", dest="locations_path", help="Location file with Latitude/Longitude columns; default Book1.xlsx")
+    parser.add_argument("--base-url", dest="base_url", help="Swiggy API host, e.g. a local stub server")
+    parser.add_argument("--concurrency", dest="max_concurrency", type=int, help="Requests in flight at once (default 8)")
+    parser.add_argument("--transport", dest="transport", choices=["http", "browser", "tiered"], help="How pages are loaded (default http)")
+    parser.add_argument("--cache-mode", dest="cache_mode", choices=["readwrite", "offline", "off"], help="Response cache mode")
+    parser.add_argument("--output-mode", dest="output_mode", choices=["wide", "normalized", "delta"], help="Table layout")
+    parser.add_argument("--formats", dest="output_formats", type=lambda value: value.split(","), help="Comma separated: excel,parquet,arrow")
+    parser.add_argument("--excel-streaming", dest="excel_streaming", action="store_true", default=None, help="Stream sheets with a write-only workbook")
+    parser.add_argument("--no-history", dest="record_history", action="store_false", default=None, help="Don't append the run to the price history")
+    parser.add_argument("--no-upload", dest="upload", action="store_false", default=None, help="Don't upload to Google Drive")
+    parser.add_argument("--drive-endpoint", dest="drive_endpoint", help="Upload to this endpoint instead of Google Drive (e.g. fakeDriveServer)")
+    return parser
+
+
+def main(argv=None):
+    from .pipeline import SweepOptions, run
+
+    args = build_parser().parse_args(argv)
+    result = run(SweepOptions.from_env(**vars(args)))
+    return 0 if result["complete"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,278 @@
+import base64
+import json
+import os
+import queue
+import threading
+from concurrent.futures import Future
+
+from . import driverProvisioning
+
+# Pool of headless browsers behind the browser transport (see transports.py).
+#
+# N worker threads each own one Chrome driver and take URLs from a shared
+# queue, so N pages load at once. A driver is quit and replaced after
+# PAGES_PER_DRIVER pages (Chrome's memory only grows over a long run) and
+# whenever it crashes; the URL it was loading goes back on the queue and is
+# retried on a fresh driver, up to MAX_ATTEMPTS times. submit() returns a
+# Future per URL; imap() yields results in input order as soon as each one (and
+# everything before it) is ready. Workers stay up until close().
+#
+# selenium/webdriver_manager are only imported when a Chrome driver is created
+# (driverProvisioning caches the driver binary and profiles, and can keep Chrome warm);
+# driver_factory(slot) can supply any object with get(), find_element() and
+# quit(); slot is the worker's index, which picks its profile and warm browser.
+# In lightweight mode (create_lightweight_driver + read_cdp_json) images, CSS and
+# fonts are blocked and the JSON is taken from the DevTools network log instead
+# of the rendered <pre> text. Try it against a local page that wraps JSON in <pre>:
+#     python -m swiggy.stubServer recorded_responses 8765 html
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+PAGES_PER_DRIVER = 50  # Recycle a driver after this many pages
+MAX_ATTEMPTS = 3  # Tries per URL when drivers crash
+# SessionNotCreatedException text when the cached ChromeDriver is too old for Chrome
+# (the same exception is raised for other reasons, e.g. a profile already in use)
+DRIVER_VERSION_MISMATCH = "only supports Chrome version"
+
+# Lightweight mode: subresources Chrome never fetches (Network.setBlockedURLs patterns)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.css",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+]
+
+
+def chrome_options(headless=True, profile_dir=None, debugger_address=None, lightweight=False):
+    """
+    Chrome options AUTOMATE.PY has always used, with an optional persistent
+    profile or a warm browser to attach to. lightweight turns images off and
+    records the DevTools network log that read_cdp_json reads bodies from.
+    """
+    from selenium.webdriver.chrome.options import Options
+
+    options = Options()
+    if lightweight:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    if debugger_address:
+        options.add_experimental_option("debuggerAddress", debugger_address)  # Already running; nothing to launch
+        return options
+    if lightweight:
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if headless:
+        options.add_argument("--headless")  # Run in the background
+    options.add_argument("--disable-blink-features=AutomationControlled")  # Avoid detection
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    if profile_dir:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    return options
+
+
+def create_chrome_driver(slot=0, options=None, lightweight=False):
+    """
+    Starts (or attaches to) Chrome for pool worker slot.
+
+    The ChromeDriver path comes from the driverProvisioning cache, each worker
+    keeps its own persistent profile, and a warm browser is used when one is
+    running (see driverProvisioning). A cached driver that is too old for the
+    installed Chrome is replaced once. In lightweight mode images, CSS and
+    fonts are blocked.
+    """
+    from selenium import webdriver
+    from selenium.common.exceptions import SessionNotCreatedException
+    from selenium.webdriver.chrome.service import Service
+
+    if options is None:
+        options = chrome_options(profile_dir=driverProvisioning.profile_dir(slot),
+                                 debugger_address=driverProvisioning.debugger_address(slot), lightweight=lightweight)
+    try:
+        driver = webdriver.Chrome(service=Service(driverProvisioning.resolve_driver_path()), options=options)
+    except SessionNotCreatedException as e:
+        if DRIVER_VERSION_MISMATCH not in (e.msg or ""):
+            raise  # Not the driver's fault (e.g. the profile is locked by another Chrome)
+        print(f"⚠️ Cached ChromeDriver was rejected ({e.msg}); fetching a matching one")
+        driver = webdriver.Chrome(service=Service(driverProvisioning.resolve_driver_path(refresh=True)), options=options)
+
+    if lightweight:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+    return driver
+
+
+def create_lightweight_driver(slot=0):
+    """create_chrome_driver in lightweight mode (pairs with read_cdp_json)"""
+    return create_chrome_driver(slot, lightweight=True)
+
+
+def _pre_json(driver):
+    page_source = driver.find_element("tag name", "pre").text  # JSON is in <pre> tag
+    return json.loads(page_source)
+
+
+def read_pre_json(driver, url):
+    """Opens a URL and parses the JSON shown in the page's <pre> tag"""
+    driver.get(url)
+    return _pre_json(driver)
+
+
+def _document_request_id(driver, url):
+    """requestId of the page's own response in the DevTools performance log (drained on every call)"""
+    request_id = None
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message["method"] != "Network.responseReceived" or message["params"].get("type") != "Document":
+            continue
+        request_id = message["params"]["requestId"]
+        if message["params"]["response"]["url"] == url:
+            break
+    return request_id
+
+
+def read_cdp_json(driver, url):
+    """
+    Opens a URL and parses the raw response body captured by DevTools
+    (Network.getResponseBody), without reading the rendered DOM. Falls back to
+    the <pre> text when the body isn't JSON (e.g. an HTML page) or wasn't logged.
+    """
+    driver.get(url)
+    request_id = _document_request_id(driver, url)
+    if request_id is not None:
+        try:
+            body = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except Exception:
+            body = None  # Body already evicted from Chrome's buffer; the DOM still has it
+        if body is not None:
+            text = base64.b64decode(body["body"]).decode("utf-8") if body.get("base64Encoded") else body["body"]
+            try:
+                return json.loads(text)
+            except ValueError:
+                pass
+    return _pre_json(driver)
+
+
+def _page_error_types():
+    """Exceptions that mean "this page is bad", not "this driver is broken" """
+    error_types = [ValueError]  # Includes json.JSONDecodeError
+    try:
+        from selenium.common.exceptions import NoSuchElementException
+        error_types.append(NoSuchElementException)
+    except ImportError:
+        pass
+    return tuple(error_types)
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass  # Already dead
+
+
+class BrowserWorkerPool:
+    """N browser drivers fed from one work queue, recycled after K pages or on a crash"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, pages_per_driver=PAGES_PER_DRIVER, driver_factory=create_chrome_driver,
+                 fetch_page=read_pre_json, max_attempts=MAX_ATTEMPTS):
+        self.workers = max(1, workers)
+        self.pages_per_driver = pages_per_driver
+        self.driver_factory = driver_factory
+        self.fetch_page = fetch_page
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        self._work = queue.Queue()
+        self._threads = []
+        self.stats = {"pages": 0, "page_errors": 0, "crashes": 0, "recycled": 0, "drivers_started": 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _worker(self, slot):
+        page_errors = _page_error_types()
+        driver = None
+        pages = 0
+        try:
+            while True:
+                item = self._work.get()
+                if item is None:
+                    return
+                future, url, attempt = item
+                if attempt == 1 and not future.set_running_or_notify_cancel():
+                    continue  # Cancelled while queued
+
+                result = None
+                try:
+                    if driver is None:
+                        driver = self.driver_factory(slot)
+                        pages = 0
+                        self._count("drivers_started")
+                    result = self.fetch_page(driver, url)
+                    self._count("pages")
+                except page_errors as e:
+                    print(f"⚠️ Could not read {url}: {e}")
+                    self._count("page_errors")
+                except Exception as e:
+                    # The driver died (or never started): replace it and give the URL another go
+                    self._count("crashes")
+                    if driver is not None:
+                        _quit(driver)
+                        driver = None
+                    if attempt < self.max_attempts:
+                        self._work.put((future, url, attempt + 1))
+                        continue
+                    print(f"❌ Giving up on {url} after {attempt} attempts: {e}")
+                pages += 1
+                future.set_result(result)
+
+                if driver is not None and pages >= self.pages_per_driver:
+                    _quit(driver)  # Fresh browser for the next pages
+                    driver = None
+                    self._count("recycled")
+        finally:
+            if driver is not None:
+                _quit(driver)
+
+    def submit(self, url):
+        """Queues a URL; returns a Future of its parsed JSON (None when the page could not be read)"""
+        future = Future()
+        with self._lock:
+            # One more worker (and, lazily, one more browser) per queued URL, up to the pool size
+            if len(self._threads) < self.workers:
+                slot = len(self._threads)
+                thread = threading.Thread(target=self._worker, args=(slot,), name=f"browser-{slot}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        self._work.put((future, url, 1))
+        return future
+
+    def imap(self, urls):
+        """Yields (url, parsed JSON or None) in input order while the pool loads the pages"""
+        urls = list(urls)
+        futures = [self.submit(url) for url in urls]
+        try:
+            for index, url in enumerate(urls):
+                yield url, futures[index].result()
+                futures[index] = None  # Let the caller's copy be the only one
+        finally:
+            for future in futures:
+                if future is not None:
+                    future.cancel()  # Stopped early: skip whatever is still queued
+
+    def map(self, urls):
+        """Returns [parsed JSON or None] in input order"""
+        return [result for _, result in self.imap(urls)]
+
+    def close(self):
+        """Stops the workers and quits their browsers"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._work.put(None)
+        for thread in threads:
+            thread.join()
@@ -0,0 +1,111 @@
+from array import array
+
+import numpy as np
+import pandas as pd
+
+# Columnar accumulation of dish rows.
+#
+# Rows are never materialised as dicts: each column is its own buffer that the
+# extractor appends to in place. Numeric columns use compact typed arrays
+# (8 bytes per value instead of a boxed Python object), and the whole buffer is
+# turned into a DataFrame once, when the query is complete. DedupBuffer drops
+# duplicate keys as rows arrive instead of after everything has been merged.
+
+
+class ColumnBuffer:
+    """Per-column buffers (typed arrays or lists) that become one DataFrame at the end"""
+
+    def __init__(self, columns, typecodes=None):
+        typecodes = typecodes or {}
+        self.columns = {
+            column: array(typecodes[column]) if column in typecodes else []
+            for column in columns
+        }
+
+    def __len__(self):
+        first = next(iter(self.columns.values()), None)
+        return 0 if first is None else len(first)
+
+    def extend(self, other, rows=None):
+        """Appends every row (or only the given row indices) of another buffer or {column: values} mapping in place"""
+        other_columns = other.columns if isinstance(other, ColumnBuffer) else other
+        for column, values in self.columns.items():
+            if rows is None:
+                values.extend(other_columns[column])
+            else:
+                other_values = other_columns[column]
+                values.extend([other_values[i] for i in rows])
+
+    def to_dict(self):
+        """Plain {column: list} copy (e.g. for the checkpoint journal)"""
+        return {column: list(values) for column, values in self.columns.items()}
+
+    @classmethod
+    def from_dict(cls, columns, typecodes=None):
+        buffer = cls(columns.keys(), typecodes)
+        buffer.extend(columns)
+        return buffer
+
+    def to_frame(self, converters=None):
+        """
+        Builds the DataFrame; typed columns are wrapped without copying (finalizes the buffer).
+
+        converters ({column: function of the column's values}) are applied to the
+        raw column values first, so a converted column is built once, already typed.
+        """
+        converters = converters or {}
+        frame_columns = {}
+        for column, values in self.columns.items():
+            if column in converters:
+                values = converters[column](values)
+            elif isinstance(values, array):
+                values = np.frombuffer(values, dtype=values.typecode)
+            frame_columns[column] = values
+        return pd.DataFrame(frame_columns)
+
+
+class DedupIndex:
+    """
+    Remembers which key combinations have been seen.
+
+    The key tuples themselves are kept (their strings are shared with the rows
+    already in the buffer), so distinct keys can never collide and memory grows
+    with the number of unique keys rather than raw hits.
+    """
+
+    def __init__(self, key_columns):
+        self.key_columns = list(key_columns)
+        self._seen = set()
+
+    def __len__(self):
+        return len(self._seen)
+
+    def unseen_rows(self, buffer):
+        """Returns the indices of rows whose key is new (first occurrence wins) and marks them seen"""
+        other_columns = buffer.columns if isinstance(buffer, ColumnBuffer) else buffer
+        keys = zip(*(other_columns[column] for column in self.key_columns))
+        seen = self._seen
+        new_rows = []
+        for row_index, key in enumerate(keys):
+            if key not in seen:
+                seen.add(key)
+                new_rows.append(row_index)
+        return new_rows
+
+
+class DedupBuffer(ColumnBuffer):
+    """ColumnBuffer that only keeps rows whose key columns it has not seen yet"""
+
+    def __init__(self, columns, typecodes=None, key_columns=(), index=None):
+        super().__init__(columns, typecodes)
+        self.index = index if index is not None else DedupIndex(key_columns)
+        self.raw_rows = 0  # Rows offered, including duplicates
+
+    def append(self, other):
+        """Adds another buffer's rows, dropping keys already seen (same as drop_duplicates(keep="first"))"""
+        self.raw_rows += len(other)
+        new_rows = self.index.unseen_rows(other)
+        if len(new_rows) == len(other):
+            self.extend(other)
+        elif new_rows:
+            self.extend(other, new_rows)
@@ -0,0 +1,137 @@
+import numpy as np
+import pandas as pd
+
+# Column width sizing for the Excel outputs.
+#
+# Widths are worked out from the DataFrame (string lengths over an optional
+# sample, max or quantile) instead of walking every written cell. What only
+# depends on the column schema (column letters and how each dtype is measured)
+# is worked out once per schema; every sheet's own data is still measured.
+# Fixed layouts go through the same path.
+
+# Column width mapping of the wide keyword sheets (DISH_FIELDS order; adjust as needed)
+FIXED_COLUMN_WIDTHS = {
+    "A": 25,  # Dish Name
+    "B": 10,  # Rating
+    "C": 25,  # Restaurant Name
+    "D": 10,  # Total Ratings
+    "E": 10,  # Price
+    "F": 20,  # Locality
+    "G": 18,  # Category
+    "H": 18,  # costForTwoMessage
+    "I": 60,  # Description (Wider for readability)
+    "J": 20,  # Area Name
+    "K": 30,  # Cuisine
+    "L": 15,  # Discount
+    "M": 20,  # Discount Details
+    "N": 15,  # Discount Type
+    "O": 14,  # Average Rating
+    "P": 20,  # Delivery Time (mins)
+    "Q": 14,  # Distance (km)
+}
+
+SAMPLE_SIZE = 2000  # Rows looked at per column when sizing (None = all rows)
+MAX_COLUMN_WIDTH = 255  # Excel's own limit
+
+
+def _arrow_string_lengths(series):
+    import pyarrow.compute as pc  # Installed whenever pandas stores strings in Arrow
+
+    # Straight on the Arrow buffers: the .str accessor costs more than the measuring on keyword-sized sheets
+    values = pc.drop_null(series.array.__arrow_array__())
+    return np.asarray(pc.utf8_length(values), dtype="float64")
+
+
+def _string_lengths(series):
+    lengths = series.str.len().to_numpy(dtype="float64", na_value=np.nan)  # Other extension strings
+    return lengths[~np.isnan(lengths)]
+
+
+def _object_lengths(series):
+    # Mostly str values: one pass over the raw values, skipping None/NaN
+    return np.fromiter((len(str(value)) for value in series.to_numpy() if value is not None and value == value),
+                       dtype="float64")
+
+
+def _distinct_value_lengths(series):
+    # Numbers repeat a lot, so measure each distinct value once
+    return np.fromiter((len(str(value)) for value in pd.unique(series.dropna())), dtype="float64")
+
+
+def _length_function(dtype):
+    """How a column of this dtype is measured"""
+    if pd.api.types.is_object_dtype(dtype):
+        return _object_lengths
+    if isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow":
+        return _arrow_string_lengths
+    if pd.api.types.is_string_dtype(dtype):
+        return _string_lengths
+    return _distinct_value_lengths
+
+
+def column_text_lengths(series):
+    """str() lengths of a column's non-empty values, as a numpy array (one per distinct value for non-string columns)"""
+    return _length_function(series.dtype)(series)
+
+
+def column_layout(df):
+    """Per-column (letter, header length, length function) for a DataFrame's schema"""
+    from openpyxl.utils import get_column_letter
+
+    return [(get_column_letter(col_idx), len(str(column)), _length_function(dtype))
+            for col_idx, (column, dtype) in enumerate(df.dtypes.items(), start=1)]
+
+
+def compute_column_widths(df, sample_size=SAMPLE_SIZE, quantile=None, layout=None):
+    """
+    Auto widths with the original adjust_column_width rule (longest value + 5, column D 3x).
+
+    sample_size limits how many rows are measured (a fixed random sample, so the
+    result is repeatable); quantile (e.g. 0.95) uses that length quantile instead
+    of the maximum so one very long description doesn't blow up a column.
+    layout is column_layout(df), when the caller already has it.
+    """
+    layout = column_layout(df) if layout is None else layout
+    if sample_size is not None and len(df) > sample_size:
+        df = df.sample(n=sample_size, random_state=0)
+
+    widths = {}
+    for (col_letter, header_length, lengths_of), (_, values) in zip(layout, df.items()):
+        lengths = lengths_of(values)
+        if not lengths.size:
+            longest = 0
+        elif quantile is not None:
+            longest = int(np.quantile(lengths, quantile))
+        else:
+            longest = int(lengths.max())
+        longest = max(longest, header_length)  # The header row counts too
+
+        width = longest * 3 if col_letter == "D" else longest + 5  # Widen column D, pad the rest
+        widths[col_letter] = min(width, MAX_COLUMN_WIDTH)
+    return widths
+
+
+class ColumnWidthSizer:
+    """Returns sheet widths: a fixed layout, or auto widths measured per sheet (layout cached per column schema)"""
+
+    def __init__(self, fixed_widths=None, sample_size=SAMPLE_SIZE, quantile=None):
+        self.fixed_widths = fixed_widths
+        self.sample_size = sample_size
+        self.quantile = quantile
+        self._layouts = {}  # (column names, dtypes) -> column_layout()
+
+    def widths(self, df):
+        if self.fixed_widths is not None:
+            return self.fixed_widths
+
+        schema = tuple(zip(df.columns, map(str, df.dtypes)))
+        layout = self._layouts.get(schema)
+        if layout is None:
+            layout = self._layouts[schema] = column_layout(df)
+        return compute_column_widths(df, self.sample_size, self.quantile, layout)
+
+
+def apply_column_widths(sheet, widths):
+    """Sets {column letter: width} on an openpyxl worksheet (regular or write-only)"""
+    for col_letter, width in widths.items():
+        sheet.column_dimensions[col_letter].width = width
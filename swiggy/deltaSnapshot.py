@@ -0,0 +1,152 @@
+import os
+
+import pandas as pd
+
+# Incremental (delta) output against the previous run's snapshot.
+#
+# Dishes are identified by (Dish Name, Restaurant Name, Locality). A run is
+# compared with the last snapshot and only the differences are written:
+#   Inserts  dishes that were not in the snapshot
+#   Updates  dishes whose price, rating or discount changed (with the old values)
+#   Deletes  dishes in the snapshot that this run did not find
+# The snapshot itself is one zstd-compressed Parquet file that is replaced
+# atomically after every run, once that run's delta tables are saved. Deletes
+# are only reported for complete sweeps; an interrupted sweep carries the
+# unseen dishes over into the new snapshot.
+
+SNAPSHOT_PATH = "swiggy_snapshot.parquet"
+KEY_COLUMNS = ["Dish Name", "Restaurant Name", "Locality"]
+TRACKED_COLUMNS = ["Price (₹)", "Rating", "Total Ratings", "Discount", "Discount Details", "Discount Type"]
+PREVIOUS_PREFIX = "Previous "  # Old values in the Updates table, e.g. "Previous Price (₹)"
+CHANGED_COLUMN = "Changed"
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """Returns the previous snapshot as a DataFrame, or None before the first run"""
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def save_snapshot(df, path=SNAPSHOT_PATH):
+    """Writes the snapshot to a temporary file and renames it into place"""
+    temp_path = path + ".tmp"
+    df.to_parquet(temp_path, index=False, compression="zstd")
+    os.replace(temp_path, path)
+
+
+def _values_differ(current, previous):
+    """Element-wise "changed" mask that treats two missing values as equal"""
+    current = current.reset_index(drop=True)
+    previous = previous.reset_index(drop=True)
+    both_missing = current.isna() & previous.isna()
+    return ~(current.eq(previous) | both_missing)
+
+
+def diff_snapshots(previous, current, key_columns=KEY_COLUMNS, tracked_columns=TRACKED_COLUMNS, include_deletes=True):
+    """
+    Compares two snapshots; returns {"Inserts", "Updates", "Deletes"} DataFrames.
+
+    Updates carry every current column, "Previous <column>" for each tracked
+    column, and a "Changed" list of the tracked columns that differ.
+    """
+    current = current.drop_duplicates(subset=key_columns, keep="first")
+    if previous is None or previous.empty:
+        empty = current.iloc[0:0]
+        return {"Inserts": current.reset_index(drop=True), "Updates": empty, "Deletes": empty}
+
+    previous = previous.drop_duplicates(subset=key_columns, keep="first")
+    tracked_columns = [column for column in tracked_columns if column in current.columns and column in previous.columns]
+    previous_names = {column: PREVIOUS_PREFIX + column for column in tracked_columns}
+
+    merged = current.merge(
+        previous[key_columns + tracked_columns].rename(columns=previous_names),
+        on=key_columns,
+        how="left",
+        indicator=True,
+    )
+    is_new = (merged["_merge"] == "left_only").to_numpy()
+    inserts = merged.loc[is_new, list(current.columns)].reset_index(drop=True)
+
+    matched = merged.loc[~is_new].reset_index(drop=True)
+    changed = pd.DataFrame({
+        column: _values_differ(matched[column], matched[previous_names[column]])
+        for column in tracked_columns
+    }, index=matched.index)
+    is_updated = changed.any(axis=1).to_numpy()
+    updates = matched.loc[is_updated, list(current.columns) + list(previous_names.values())].reset_index(drop=True)
+    updates[CHANGED_COLUMN] = [
+        ", ".join(column for column, differs in zip(tracked_columns, row) if differs)
+        for row in changed.loc[is_updated].itertuples(index=False, name=None)
+    ]
+
+    if include_deletes:
+        gone = previous.merge(current[key_columns], on=key_columns, how="left", indicator=True)
+        deletes = gone.loc[gone["_merge"] == "left_only", list(previous.columns)].reset_index(drop=True)
+    else:
+        deletes = previous.iloc[0:0]
+    return {"Inserts": inserts, "Updates": updates, "Deletes": deletes}
+
+
+class DeltaTracker:
+    """Collects a sweep's rows and turns them into delta tables plus the next snapshot"""
+
+    def __init__(self, snapshot_path=SNAPSHOT_PATH, key_columns=KEY_COLUMNS, tracked_columns=TRACKED_COLUMNS):
+        self.snapshot_path = snapshot_path
+        self.key_columns = list(key_columns)
+        self.tracked_columns = list(tracked_columns)
+        self._frames = []
+        self._counts = {}
+        self.next_snapshot = None  # Built by finish(), stored by commit()
+        self.raw_rows = 0
+
+    def add_query(self, query, df):
+        """Adds one keyword's cleaned wide DataFrame (the first keyword to find a dish is kept)"""
+        self.raw_rows += len(df)
+        self._frames.append(df.assign(Keyword=query))
+
+    def current(self):
+        if not self._frames:
+            return None
+        return pd.concat(self._frames, ignore_index=True).drop_duplicates(subset=self.key_columns, keep="first")
+
+    def finish(self, complete=True):
+        """
+        Diffs the run against the stored snapshot, builds the new snapshot and
+        returns the delta tables. complete=False (some pairs failed) reports no
+        deletes and keeps the dishes that were not seen in the snapshot; a run
+        that found nothing at all is treated the same way. The stored snapshot
+        is only replaced by commit(), once the delta tables have been saved.
+        """
+        previous = load_snapshot(self.snapshot_path)
+        current = self.current()
+        if current is None:
+            current = previous.iloc[0:0] if previous is not None else pd.DataFrame(columns=self.key_columns)
+        complete = complete and not current.empty
+
+        tables = diff_snapshots(previous, current, self.key_columns, self.tracked_columns, include_deletes=complete)
+
+        snapshot = current
+        if not complete and previous is not None:
+            unseen = previous.merge(current[self.key_columns], on=self.key_columns, how="left", indicator=True)
+            carried = unseen.loc[unseen["_merge"] == "left_only"].drop(columns="_merge")
+            snapshot = pd.concat([current, carried], ignore_index=True)
+        self.next_snapshot = snapshot if not snapshot.empty else None
+
+        self._counts = {
+            "previous": 0 if previous is None else len(previous),
+            "current": len(current),
+            **{name.lower(): len(table) for name, table in tables.items()},
+        }
+        return tables
+
+    def commit(self):
+        """Replaces the stored snapshot with the one finish() built; returns whether one was written"""
+        if self.next_snapshot is None:
+            return False
+        save_snapshot(self.next_snapshot, self.snapshot_path)
+        self.next_snapshot = None
+        return True
+
+    def summary(self):
+        return {"raw_rows": self.raw_rows, **self._counts}
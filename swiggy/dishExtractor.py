@@ -0,0 +1,242 @@
+import functools
+import re
+
+import numpy as np
+import pandas as pd
+
+# Declarative extraction of dish rows from Swiggy search/v3 responses.
+#
+# A field spec maps an output column to a dotted path inside a DISH card's
+# "card.card" object, a default for when the path is missing, and an optional
+# transform. DishExtractor splits the spec once into parent lookups and leaves,
+# so shared parents like "restaurant.info" are looked up once per card, and
+# projects every card straight into per-column lists in a single pass.
+
+
+def convert_total_ratings(rating_str):
+    """
+    Converts "K+" formatted ratings into numerical values.
+    Example: "1.3K+" → 1300, "10K+" → 10000, "123" → 123
+    """
+    if isinstance(rating_str, str):
+        rating_str = rating_str.replace("+", "").strip()  # Remove "+"
+
+        # Convert "K" values (e.g., "1.3K" -> 1300)
+        match = re.match(r"([\d.]+)K", rating_str, re.IGNORECASE)
+        if match:
+            return int(float(match.group(1)) * 1000)
+
+        # Convert "M" values if any (e.g., "2.5M" -> 2,500,000)
+        match = re.match(r"([\d.]+)M", rating_str, re.IGNORECASE)
+        if match:
+            return int(float(match.group(1)) * 1_000_000)
+
+        # Convert normal numbers
+        try:
+            return int(rating_str)
+        except ValueError:
+            return 0  # Default to 0 if unknown format
+    return 0  # Default for non-string values
+
+
+# Memoized scalar conversion; a sweep only ever sees a few hundred distinct rating strings
+_convert_total_ratings_cached = functools.lru_cache(maxsize=4096)(convert_total_ratings)
+
+
+def convert_total_ratings_series(ratings):
+    """
+    Converts a whole column of "K+"/"M+" rating strings at once.
+
+    The column is factorized into its distinct values, each distinct value is
+    converted once (memoized across calls) and the results are scattered back
+    with a single take, so the output is identical to mapping convert_total_ratings.
+    """
+    ratings = pd.Series(ratings) if not isinstance(ratings, pd.Series) else ratings
+    codes, uniques = pd.factorize(ratings, use_na_sentinel=True)
+    # The trailing slot holds the conversion for missing values (code -1)
+    converted = np.fromiter(
+        (_convert_total_ratings_cached(value) for value in uniques),
+        dtype=np.int64,
+        count=len(uniques),
+    )
+    converted = np.append(converted, convert_total_ratings(None))
+    return pd.Series(converted.take(codes), index=ratings.index, name=ratings.name)
+
+
+def convert_total_ratings_values(ratings):
+    """
+    Converts a buffer column (any sequence) of rating strings into an int64
+    array, memoized per distinct string; used before the DataFrame is built,
+    so the column never becomes a string column at all.
+    """
+    return np.fromiter(map(_convert_total_ratings_cached, ratings), dtype=np.int64, count=len(ratings))
+
+
+def _paise_to_rupees(price):
+    return price / 100  # Convert paise to ₹
+
+
+def _join_cuisines(cuisines):
+    return ", ".join(cuisines)
+
+
+# (column, path inside card.card, default, transform) — the one dish schema both
+# scripts read: swiggyAutomation.py's columns plus the extras AUTOMATE.PY exports.
+# Since the two were merged, swiggyAutomation.py's wide keyword sheets have 17
+# columns instead of 14: Average Rating, Delivery Time (mins) and Distance (km)
+# follow Discount Type (Restaurant ID is dropped before writing).
+DISH_FIELDS = [
+    ("Dish Name", "info.name", "N/A", None),
+    ("Rating", "info.ratings.aggregatedRating.rating", "N/A", None),
+    ("Restaurant Name", "restaurant.info.name", "N/A", None),
+    ("Total Ratings", "restaurant.info.totalRatingsString", "0", None),  # See DISH_COLUMN_CONVERTERS
+    ("Price (₹)", "info.price", 0, _paise_to_rupees),
+    ("Locality", "restaurant.info.locality", "N/A", None),
+    ("Category", "info.category", "N/A", None),
+    ("costForTwoMessage", "restaurant.info.costForTwoMessage", "N/A", None),
+    ("Description", "info.description", "N/A", None),
+    ("Area Name", "restaurant.info.areaName", "N/A", None),
+    ("Cuisine", "restaurant.info.cuisines", [], _join_cuisines),
+    ("Discount", "restaurant.info.aggregatedDiscountInfoV3.header", "N/A", None),
+    ("Discount Details", "restaurant.info.aggregatedDiscountInfoV3.subHeader", "N/A", None),
+    ("Discount Type", "restaurant.info.aggregatedDiscountInfoV3.discountTag", "N/A", None),
+    ("Average Rating", "restaurant.info.avgRating", "N/A", None),
+    ("Delivery Time (mins)", "restaurant.info.sla.slaString", "N/A", None),
+    ("Distance (km)", "restaurant.info.sla.lastMileTravelString", "N/A", None),
+    ("Restaurant ID", "restaurant.info.id", None, None),  # Only written by the normalized output
+]
+
+# Numeric columns of DISH_FIELDS, stored as typed arrays ("d" = float64)
+DISH_COLUMN_TYPES = {
+    "Price (₹)": "d",
+}
+
+# Whole-column conversions applied to the buffer columns once per query, after deduplication
+DISH_COLUMN_CONVERTERS = {
+    "Total Ratings": convert_total_ratings_values,
+}
+
+# AUTOMATE.PY's export layout as a view of DISH_FIELDS: {exported column: DISH_FIELDS column}
+AUTOMATE_COLUMNS = {
+    "Dish Name": "Dish Name",
+    "Category": "Category",
+    "Description": "Description",
+    "Price (₹)": "Price (₹)",
+    "Rating": "Rating",
+    "Restaurant Name": "Restaurant Name",
+    "Restaurant Address": "Locality",
+    "Cuisine": "Cuisine",
+    "Cost for Two (₹)": "costForTwoMessage",
+    "Average Rating": "Average Rating",
+    "Total Ratings": "Total Ratings",
+    "Delivery Time (mins)": "Delivery Time (mins)",
+    "Distance (km)": "Distance (km)",
+}
+
+
+def select_columns(df, column_map):
+    """Picks and renames a frame's columns per {exported column: source column}"""
+    return df[list(column_map.values())].set_axis(list(column_map.keys()), axis=1)
+
+
+_EMPTY = {}  # Stand-in for missing or non-dict parents, so every lookup falls back to its default
+
+
+def is_search_result(data):
+    """True for a search response with a data object (not an error or blocked payload)"""
+    return isinstance(data, dict) and isinstance(data.get("data"), dict)
+
+
+def find_dish_cards(data, all_groups=False):
+    """
+    Returns the DISH cards of a search response.
+
+    By default only the first groupedCard is used (as swiggyAutomation.py always
+    did); all_groups=True collects DISH cards from every groupedCard. Raises
+    ValueError when data is not a search response at all.
+    """
+    if not is_search_result(data):
+        status = data.get("statusCode") if isinstance(data, dict) else None
+        raise ValueError(f"Response has no data object (statusCode {status})")
+    dish_cards = []
+    for card in data["data"].get("cards", []):
+        grouped_card = card.get("groupedCard")
+        if grouped_card is None:
+            continue
+        cards = grouped_card.get("cardGroupMap", {}).get("DISH", {}).get("cards", [])
+        if not all_groups:
+            return cards
+        dish_cards.extend(cards)
+    return dish_cards
+
+
+def _compile_fields(fields):
+    """
+    Turns a field spec into parent lookup steps and per-column leaves.
+
+    Every distinct parent path (e.g. ("restaurant", "info")) becomes one step,
+    resolved once per card from the longest parent it extends, so
+    restaurant.info is looked up once and reused for its discount and sla
+    children. Each column then needs a single .get() on its resolved parent.
+    """
+    parents = sorted({tuple(path.split(".")[:-1]) for _, path, _, _ in fields}, key=len)
+    steps = []  # (index of the parent this one extends or None for the card, remaining keys)
+    for parent in parents:
+        base = None
+        for index, candidate in enumerate(parents[:len(steps)]):
+            if parent[:len(candidate)] == candidate and (base is None or len(candidate) > len(parents[base])):
+                base = index
+        steps.append((base, parent[len(parents[base]):] if base is not None else parent))
+
+    leaves = [
+        (parents.index(tuple(path.split(".")[:-1])), path.split(".")[-1], default, transform)
+        for _, path, default, transform in fields
+    ]
+    return steps, leaves
+
+
+def _resolve(node, keys):
+    """Walks keys from node; _EMPTY as soon as a step is missing or not a dict"""
+    for key in keys:
+        node = node.get(key, _EMPTY)
+        if not isinstance(node, dict):
+            return _EMPTY
+    return node
+
+
+class DishExtractor:
+    """Field spec that projects DISH cards into column lists"""
+
+    def __init__(self, fields=DISH_FIELDS, required_path="info"):
+        self.fields = list(fields)
+        self.columns = [column for column, _, _, _ in self.fields]
+        # Cards whose required object is missing or empty are skipped (no dish info)
+        self.required_key = required_path
+        self._steps, self._leaves = _compile_fields(self.fields)
+
+    def empty_columns(self):
+        """Returns a fresh {column: []} mapping in spec order"""
+        return {column: [] for column in self.columns}
+
+    def extract(self, data, all_groups=False, columns=None):
+        """Projects every dish of a search response into {column: [values]}"""
+        return self.extract_cards(find_dish_cards(data, all_groups), columns)
+
+    def extract_cards(self, dish_cards, columns=None):
+        """Projects DISH cards into per-column lists, appending to columns (any .append()-able values) when given"""
+        if columns is None:
+            columns = self.empty_columns()
+        appends = [columns[column].append for column in self.columns]
+        steps, leaves, required_key = self._steps, self._leaves, self.required_key
+        for dish_card in dish_cards:
+            card = _resolve(dish_card, ("card", "card")) if isinstance(dish_card, dict) else _EMPTY
+            if not card.get(required_key):
+                continue
+
+            resolved = []
+            for base, keys in steps:
+                resolved.append(_resolve(card if base is None else resolved[base], keys))
+            for append, (parent, leaf, default, transform) in zip(appends, leaves):
+                value = resolved[parent].get(leaf, default)
+                append(value if transform is None else transform(value))
+        return columns
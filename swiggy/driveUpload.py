@@ -0,0 +1,135 @@
+import os
+import socket
+import threading
+import time
+
+from . import rateLimiter
+
+# Google Drive uploads.
+#
+# One authenticated Drive client is built per (credentials file, endpoint) and
+# reused for every upload. Files are sent as resumable, chunked uploads: each
+# chunk is acknowledged by Drive, and after a dropped connection or a 5xx the
+# upload asks the session how many bytes arrived and carries on from there
+# instead of re-sending the whole workbook.
+#
+# api_endpoint points the client at another server (e.g. fakeDriveServer.py);
+# such clients are built from the bundled discovery document and send no
+# credentials.
+
+SCOPES = ["https://www.googleapis.com/auth/drive.file"]
+SERVICE_ACCOUNT_FILE = "credentials.json"  # Path to your service account JSON file
+XLSX_MIMETYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+CHUNK_SIZE = 8 * 1024 * 1024  # Bytes per request; Drive needs a multiple of 256 KiB
+CHUNK_ALIGNMENT = 256 * 1024
+MAX_RETRIES = 5  # Consecutive failed requests before an upload gives up
+
+_services = {}  # (credentials file, api_endpoint) -> Drive service
+_services_lock = threading.Lock()
+
+
+def _build_service(credentials_file, api_endpoint):
+    from googleapiclient.discovery import build, build_from_document
+
+    if api_endpoint is None:
+        from google.oauth2 import service_account
+
+        credentials = service_account.Credentials.from_service_account_file(credentials_file, scopes=SCOPES)
+        return build("drive", "v3", credentials=credentials, cache_discovery=False)
+
+    # Uploads go to the discovery document's rootUrl, which client_options cannot override
+    import json
+    from googleapiclient.discovery_cache import get_static_doc
+    from googleapiclient.http import build_http
+
+    document = json.loads(get_static_doc("drive", "v3"))
+    document["rootUrl"] = api_endpoint.rstrip("/") + "/"
+    return build_from_document(document, http=build_http())  # build_http keeps 308 from being followed as a redirect
+
+
+def get_drive_service(credentials_file=SERVICE_ACCOUNT_FILE, api_endpoint=None):
+    """Returns the cached Drive client for these credentials (built on first use)"""
+    key = (credentials_file, api_endpoint)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = _build_service(credentials_file, api_endpoint)
+        return service
+
+
+def aligned_chunk_size(chunk_size):
+    """Rounds a chunk size up to the 256 KiB multiple Drive requires"""
+    return max(1, -(-chunk_size // CHUNK_ALIGNMENT)) * CHUNK_ALIGNMENT
+
+
+def print_progress(file_name, uploaded, total):
+    percent = 100 * uploaded / total if total else 100
+    # One write per line, so lines from the upload thread don't split the sweep's output
+    print(f"⬆️ {file_name}: {uploaded / 1_048_576:.1f}/{total / 1_048_576:.1f} MB ({percent:.0f}%)\n", end="", flush=True)
+
+
+def milestone_progress(step=25):
+    """Progress callback for background uploads: prints only when the upload passes the next step percent"""
+    reported = [-1]
+
+    def report(file_name, uploaded, total):
+        percent = 100 * uploaded / total if total else 100
+        milestone = int(percent // step) * step
+        if milestone > reported[0]:
+            reported[0] = milestone
+            print_progress(file_name, uploaded, total)
+
+    return report
+
+
+def _is_retryable(error):
+    from googleapiclient.errors import HttpError, ResumableUploadError
+
+    if isinstance(error, (HttpError, ResumableUploadError)):
+        return error.resp.status in rateLimiter.RETRY_STATUS_CODES
+    import httplib2
+
+    return isinstance(error, (ConnectionError, socket.timeout, httplib2.HttpLib2Error))
+
+
+def upload_file(file_path, folder_id, mimetype=XLSX_MIMETYPE, chunk_size=CHUNK_SIZE, max_retries=MAX_RETRIES,
+                progress=print_progress, service=None, name=None):
+    """
+    Uploads a file into a Drive folder with a resumable, chunked upload; returns the file ID.
+    name is the Drive file name (default: the local base name).
+
+    Every failed request (connection error, 429/5xx) is retried after a jittered
+    backoff; the retry resumes from the last byte the server acknowledged. The
+    retry budget resets whenever a chunk goes through.
+    """
+    from googleapiclient.http import MediaFileUpload
+
+    service = service or get_drive_service()
+    file_name = name or os.path.basename(file_path)
+    file_metadata = {
+        "name": file_name,
+        "parents": [folder_id],  # Google Drive Folder ID
+    }
+    media = MediaFileUpload(file_path, mimetype=mimetype, chunksize=aligned_chunk_size(chunk_size), resumable=True)
+    request = service.files().create(body=file_metadata, media_body=media, fields="id")
+
+    total = media.size()
+    failures = 0
+    response = None
+    while response is None:
+        try:
+            status, response = request.next_chunk()
+        except Exception as e:
+            if not _is_retryable(e) or failures >= max_retries:
+                raise
+            delay = rateLimiter.backoff_delay(failures)
+            failures += 1
+            print(f"⚠️ Upload of {file_name} interrupted ({e}); resuming in {delay:.1f}s (retry {failures}/{max_retries})")
+            time.sleep(delay)
+            continue
+
+        failures = 0
+        if progress is not None:
+            progress(file_name, status.resumable_progress if status else total, total)
+    return response.get("id")
@@ -0,0 +1,185 @@
+import datetime
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+
+# ChromeDriver and Chrome startup for the browser pool.
+#
+# ChromeDriverManager().install() asks the network for the latest driver on
+# every call; here it runs once and the resolved path is kept in
+# DRIVER_CACHE_PATH, so later runs start offline. It is refreshed after
+# REFRESH_AFTER_DAYS (falling back to the cached driver when offline) and
+# whenever Chrome reports the cached driver's version as too old.
+#
+# Each pool worker gets its own persistent profile directory (Chrome locks a
+# profile to one process), so cookies and the HTTP cache survive between runs.
+# Keeping Chrome itself warm across runs is optional: start browsers once with
+#     python -m swiggy.driverProvisioning warm [workers] [port]
+# and set SWIGGY_CHROME_DEBUG_PORT=<port>; worker N then attaches to the browser
+# on port + N instead of launching one.
+#
+#     python -m swiggy.driverProvisioning install   (resolve and cache the driver now)
+
+DRIVER_CACHE_PATH = "swiggy_chromedriver.json"
+REFRESH_AFTER_DAYS = 7
+PROFILE_ROOT = os.environ.get("SWIGGY_CHROME_PROFILE", "swiggy_chrome_profile")  # "" disables persistent profiles
+DEBUG_PORT = 9222  # First port used by "warm"
+CHROME_BINARIES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+_driver_path = None
+_driver_lock = threading.Lock()
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cache(cache_path, driver_path):
+    entry = {"driver_path": driver_path, "resolved_at": datetime.datetime.now().isoformat(timespec="seconds")}
+    tmp_path = cache_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_path, cache_path)
+
+
+def _is_fresh(entry):
+    try:
+        resolved_at = datetime.datetime.fromisoformat(entry["resolved_at"])
+    except (KeyError, TypeError, ValueError):
+        return False
+    return datetime.datetime.now() - resolved_at < datetime.timedelta(days=REFRESH_AFTER_DAYS)
+
+
+def _install_driver():
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    return ChromeDriverManager().install()
+
+
+def resolve_driver_path(cache_path=DRIVER_CACHE_PATH, refresh=False):
+    """
+    Returns the ChromeDriver executable to use.
+
+    SWIGGY_CHROMEDRIVER wins when set. Otherwise the cached path is used while it
+    exists and is fresh; refresh=True (or a stale/missing cache) runs
+    webdriver_manager again. The result is kept for the rest of the process.
+    """
+    global _driver_path
+    explicit = os.environ.get("SWIGGY_CHROMEDRIVER")
+    if explicit:
+        return explicit
+
+    with _driver_lock:
+        if _driver_path is not None and not refresh:
+            return _driver_path
+
+        entry = _load_cache(cache_path)
+        cached = entry.get("driver_path") if entry else None
+        if cached and not os.path.exists(cached):
+            cached = None
+        if cached and not refresh and _is_fresh(entry):
+            _driver_path = cached
+            return cached
+
+        try:
+            driver_path = _install_driver()
+        except Exception as e:
+            if cached is None:
+                raise
+            print(f"⚠️ Could not refresh ChromeDriver ({e}); using cached {cached}")
+            _driver_path = cached
+            return cached
+
+        _save_cache(cache_path, driver_path)
+        print(f"🧩 ChromeDriver cached: {driver_path}")
+        _driver_path = driver_path
+        return driver_path
+
+
+def profile_dir(slot=0, root=None):
+    """Persistent profile directory of one worker (None when profiles are disabled)"""
+    root = PROFILE_ROOT if root is None else root
+    if not root:
+        return None
+    return os.path.abspath(os.path.join(root, f"worker-{slot}"))
+
+
+def _is_listening(port, host="127.0.0.1"):
+    try:
+        with socket.create_connection((host, port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def debugger_address(slot=0):
+    """host:port of the warm browser for this worker, or None (no SWIGGY_CHROME_DEBUG_PORT, or nothing listening)"""
+    base_port = os.environ.get("SWIGGY_CHROME_DEBUG_PORT")
+    if not base_port:
+        return None
+    port = int(base_port) + slot
+    if not _is_listening(port):
+        print(f"⚠️ No warm browser on port {port}; launching a new one")
+        return None
+    return f"127.0.0.1:{port}"
+
+
+def find_chrome_binary():
+    """Chrome executable from SWIGGY_CHROME_BINARY or the PATH (None if not found)"""
+    explicit = os.environ.get("SWIGGY_CHROME_BINARY")
+    if explicit:
+        return explicit
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def launch_warm_browsers(workers=1, base_port=DEBUG_PORT, headless=True, binary=None):
+    """Starts one detached Chrome per worker with a remote debugging port; returns the processes"""
+    binary = binary or find_chrome_binary()
+    if binary is None:
+        raise FileNotFoundError("Chrome not found; set SWIGGY_CHROME_BINARY")
+
+    # Detached, so the browsers outlive this command
+    detach = {"creationflags": subprocess.DETACHED_PROCESS} if os.name == "nt" else {"start_new_session": True}
+    processes = []
+    for slot in range(workers):
+        port = base_port + slot
+        if _is_listening(port):
+            print(f"♨️ Port {port} already has a browser")
+            continue
+        args = [binary, f"--remote-debugging-port={port}", "--no-sandbox", "--disable-dev-shm-usage",
+                "--disable-blink-features=AutomationControlled"]
+        if headless:
+            args.append("--headless=new")
+        profile = profile_dir(slot)
+        if profile:
+            args.append(f"--user-data-dir={profile}")
+        args.append("about:blank")
+        processes.append(subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **detach))
+        print(f"♨️ Warm browser for worker {slot} on port {port}")
+    return processes
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+
+    if command == "install":
+        print(f"🧩 {resolve_driver_path(refresh=True)}")
+    elif command == "warm":
+        workers = int(sys.argv[2]) if len(sys.argv) > 2 else 1
+        base_port = int(sys.argv[3]) if len(sys.argv) > 3 else DEBUG_PORT
+        launch_warm_browsers(workers, base_port)
+        print(f"✅ Set SWIGGY_CHROME_DEBUG_PORT={base_port} to use them")
+    else:
+        print("Usage: python -m swiggy.driverProvisioning install | warm [workers] [port]")
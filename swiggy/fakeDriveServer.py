@@ -0,0 +1,136 @@
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# Local stand-in for the Google Drive resumable upload endpoint.
+#
+# Implements just enough of the protocol for driveUpload.py: the POST that opens
+# an upload session, chunked PUTs with Content-Range, and "bytes */<size>" status
+# queries answered with 308 + Range. fail_every makes every Nth chunk arrive only
+# half-way and answer 503, so resuming from the acknowledged byte is exercised.
+# Finished files are written to UPLOADS_DIR. Try it with:
+#     python -m swiggy.fakeDriveServer fake_drive 8766 3
+#     SWIGGY_DRIVE_ENDPOINT=http://127.0.0.1:8766 python swiggyAutomation.py
+
+UPLOADS_DIR = "fake_drive"
+UPLOAD_PATH = "/upload/drive/v3/files"
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (?:(\d+)-(\d+)|\*)/(\d+|\*)")
+
+
+class FakeDriveHandler(BaseHTTPRequestHandler):
+    """Accepts resumable uploads over keep-alive HTTP/1.1"""
+    protocol_version = "HTTP/1.1"
+    uploads_dir = UPLOADS_DIR
+    fail_every = 0  # 0 = never fail
+
+    # Shared by every handler of one server (see make_server)
+    sessions = None  # upload id -> {"name", "data"}
+    counters = None
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != UPLOAD_PATH or parse_qs(url.query).get("uploadType") != ["resumable"]:
+            self._send(404, {"error": "not found"})
+            return
+
+        metadata = json.loads(self._read_body() or b"{}")
+        upload_id = str(next(self.counters["sessions"]))
+        self.sessions[upload_id] = {"name": metadata.get("name", f"upload-{upload_id}"), "data": bytearray()}
+        host, port = self.server.server_address[:2]
+        self._send(200, None, {"Location": f"http://{host}:{port}{UPLOAD_PATH}?uploadType=resumable&upload_id={upload_id}"})
+
+    def do_PUT(self):
+        upload_id = parse_qs(urlparse(self.path).query).get("upload_id", [""])[0]
+        session = self.sessions.get(upload_id)
+        body = self._read_body()
+        if session is None:
+            self._send(404, {"error": "upload session not found"})
+            return
+
+        match = CONTENT_RANGE_PATTERN.fullmatch(self.headers.get("Content-Range", ""))
+        if match is None:
+            self._send(400, {"error": "bad Content-Range"})
+            return
+        start, _, total = match.groups()
+        data = session["data"]
+
+        if start is not None:
+            start = int(start)
+            if start > len(data):
+                self._send(400, {"error": f"chunk starts at {start}, only {len(data)} bytes received"})
+                return
+            chunk_number = next(self.counters["chunks"])
+            if self.fail_every and chunk_number % self.fail_every == 0:
+                # Simulate a connection that died half-way through the chunk
+                data[start:] = body[:len(body) // 2]
+                self._send(503, {"error": "injected failure"})
+                return
+            data[start:] = body
+
+        if total != "*" and len(data) >= int(total):
+            self._finish(upload_id, session)
+        else:
+            headers = {"Range": f"bytes=0-{len(data) - 1}"} if data else {}
+            self._send(308, None, headers)
+
+    def _finish(self, upload_id, session):
+        # Names may contain "/" (e.g. parquet/run=.../part-0.parquet); keep that layout on disk
+        file_path = os.path.join(self.uploads_dir, *session["name"].split("/"))
+        try:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, "wb") as f:
+                f.write(session["data"])
+        except OSError as e:
+            self._send(500, {"error": str(e)})
+            return
+        self._send(200, {"id": f"fake-{upload_id}", "name": session["name"]})
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(uploads_dir=UPLOADS_DIR, port=0, fail_every=0, handler=FakeDriveHandler):
+    """Creates (but does not start) a fake Drive server; port 0 picks a free port"""
+    handler_class = type("BoundFakeDriveHandler", (handler,), {
+        "uploads_dir": uploads_dir,
+        "fail_every": fail_every,
+        "sessions": {},
+        "counters": {"sessions": itertools.count(1), "chunks": itertools.count(1)},
+    })
+    return ThreadingHTTPServer(("127.0.0.1", port), handler_class)
+
+
+def serve_in_background(uploads_dir=UPLOADS_DIR, port=0, fail_every=0):
+    """Starts a fake Drive server on a daemon thread; returns (server, endpoint URL)"""
+    server = make_server(uploads_dir, port, fail_every)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+if __name__ == "__main__":
+    uploads_dir = sys.argv[1] if len(sys.argv) > 1 else UPLOADS_DIR
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8766
+    fail_every = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    server = make_server(uploads_dir, port, fail_every)
+    print(f"✅ Fake Drive upload endpoint saving to {uploads_dir} on http://127.0.0.1:{server.server_port}")
+    server.serve_forever()
@@ -0,0 +1,103 @@
+import asyncio
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Sentinel pushed onto the results queue once the sweep has finished
+_DONE = object()
+
+
+async def _fetch_unit(semaphore, fetch_fn, parse_fn, query, location, checkpoint):
+    """Fetches and parses a single (query, location) pair while holding a concurrency slot."""
+    lat = location["Latitude"]
+    lng = location["Longitude"]
+
+    # Reuse units that a previous (interrupted) run already finished
+    if checkpoint is not None and checkpoint.is_done(query, lat, lng):
+        return checkpoint.completed_rows(query, lat, lng)
+
+    async with semaphore:
+        print(f"   📍 Checking location: Latitude {lat}, Longitude {lng} ({query})")
+        try:
+            # The HTTP client is blocking, so run it on a worker thread
+            data = await asyncio.to_thread(fetch_fn, lat, lng, query)
+        except Exception as e:
+            print(f"⚠️ Request failed for {query} at ({lat}, {lng}): {e}")
+            return None
+
+    if not data:
+        return None  # Skip if no data (not journaled, so a restart retries it)
+
+    try:
+        result = parse_fn(data, query)
+    except Exception as e:
+        # A malformed or blocked payload is a failure, not "no dishes": leave it unjournaled so it is retried
+        print(f"⚠️ Error extracting data for {query} at ({lat}, {lng}): {e}")
+        return None
+
+    if checkpoint is not None:
+        checkpoint.record(query, lat, lng, result)
+    return result
+
+
+async def _run_sweep(search_queries, locations, fetch_fn, parse_fn, max_concurrency, checkpoint, accumulator_factory, results_queue):
+    """Schedules every (query, location) pair and publishes finished queries in order."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Size the worker threads to the concurrency limit instead of the default pool size
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_concurrency))
+
+    # One task list per query, in location order, so "first seen" dedup stays deterministic
+    query_tasks = [
+        (query, [asyncio.create_task(_fetch_unit(semaphore, fetch_fn, parse_fn, query, location, checkpoint)) for location in locations])
+        for query in search_queries
+    ]
+
+    for query, tasks in query_tasks:
+        # Hand each location's rows to the accumulator in location order, then let them go
+        accumulator = accumulator_factory()
+        while tasks:
+            result = await tasks.pop(0)
+            if result is not None:
+                accumulator.append(result)
+        results_queue.put((query, accumulator))
+
+
+def sweep(search_queries, locations, fetch_fn, parse_fn, max_concurrency=8, checkpoint=None, accumulator_factory=list):
+    """
+    Fetches every (query, location) pair concurrently and yields (query, results) per query.
+
+    fetch_fn(lat, lng, query) returns the decoded JSON response (or None) and
+    parse_fn(data, query) turns it into parsed rows (None when there are none)
+    and raises when the response can't be parsed. Queries are yielded in the
+    order given as soon as all of their locations are done, while later queries
+    keep fetching in the background.
+
+    Each query's parsed results are appended, in location order, to a fresh
+    accumulator_factory() object (a list by default) as soon as they arrive, so
+    an accumulator that merges or deduplicates keeps only what it needs.
+
+    With a SweepCheckpoint, units it already holds are not fetched again and
+    every newly finished unit is journaled as soon as it is parsed.
+    """
+    results_queue = queue.Queue()
+
+    def run():
+        try:
+            asyncio.run(_run_sweep(search_queries, locations, fetch_fn, parse_fn, max_concurrency, checkpoint, accumulator_factory, results_queue))
+            results_queue.put(_DONE)
+        except BaseException as e:
+            results_queue.put(e)
+
+    worker = threading.Thread(target=run, name="swiggy-fetch-engine", daemon=True)
+    worker.start()
+
+    while True:
+        item = results_queue.get()
+        if item is _DONE:
+            break
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+    worker.join()
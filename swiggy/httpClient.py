@@ -0,0 +1,111 @@
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared keep-alive HTTP client used for every Swiggy API call.
+#
+# A single requests.Session keeps TCP+TLS connections open between calls, so a
+# sweep only pays for the handshake once per pooled connection instead of once
+# per request.
+
+DEFAULT_POOL_SIZE = 10  # Connections kept open per host without a host_pool_sizes entry
+CONNECT_TIMEOUT = 5  # Seconds to establish a connection
+READ_TIMEOUT = 20  # Seconds to wait for the response body
+
+# Request headers sent to the Swiggy API (a desktop browser's User-Agent, to avoid blocking)
+REQUEST_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _mount_host_adapters(session, host_pool_sizes, default_pool_size):
+    """Mounts one pooled adapter per configured host plus a default for everything else"""
+    default_adapter = HTTPAdapter(pool_connections=default_pool_size, pool_maxsize=default_pool_size, pool_block=True)
+    session.mount("https://", default_adapter)
+    session.mount("http://", default_adapter)
+
+    for host, pool_size in host_pool_sizes.items():
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        session.mount(f"https://{host}/", adapter)
+        session.mount(f"http://{host}/", adapter)
+
+
+def create_session(host_pool_sizes=None, default_pool_size=DEFAULT_POOL_SIZE, headers=None):
+    """Creates a pooled requests.Session with per-host connection limits ({host: pool size}, e.g. from SwiggyClient's concurrency)"""
+    session = requests.Session()
+    _mount_host_adapters(session, host_pool_sizes or {}, default_pool_size)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+def get_session():
+    """Returns the process-wide shared session, creating it on first use"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
+
+
+def configure(host_pool_sizes=None, default_pool_size=DEFAULT_POOL_SIZE, headers=None):
+    """Replaces the shared session (e.g. to size pools for a different concurrency)"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session = create_session(host_pool_sizes, default_pool_size, headers)
+    return _session
+
+
+def get(url, timeout=None, **kwargs):
+    """GET through the shared session with explicit connect/read timeouts"""
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    return get_session().get(url, timeout=timeout, **kwargs)
+
+
+def connection_stats(session=None):
+    """
+    Summarizes connection reuse per host for the shared (or given) session.
+
+    Returns {"hosts": {host: {"requests": n, "connections": n, "reused": n}},
+    "requests": n, "connections": n, "reuse_ratio": 0..1}.
+    """
+    session = session or _session
+    hosts = {}
+    if session is not None:
+        adapters = {id(adapter): adapter for adapter in session.adapters.values()}.values()
+        for adapter in adapters:
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                stats = hosts.setdefault(pool.host, {"requests": 0, "connections": 0, "reused": 0})
+                stats["requests"] += pool.num_requests
+                stats["connections"] += pool.num_connections
+
+    for stats in hosts.values():
+        stats["reused"] = max(stats["requests"] - stats["connections"], 0)
+
+    total_requests = sum(stats["requests"] for stats in hosts.values())
+    total_connections = sum(stats["connections"] for stats in hosts.values())
+    reuse_ratio = (total_requests - total_connections) / total_requests if total_requests else 0.0
+    return {
+        "hosts": hosts,
+        "requests": total_requests,
+        "connections": total_connections,
+        "reuse_ratio": max(reuse_ratio, 0.0),
+    }
+
+
+def host_of(url):
+    """Returns the host[:port] part of a URL, as used for the per-host pool mounts"""
+    return urlparse(url).netloc
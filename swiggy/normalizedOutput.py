@@ -0,0 +1,97 @@
+import hashlib
+
+import pandas as pd
+
+# Normalized (star schema) output for a whole sweep.
+#
+# Instead of repeating every restaurant attribute on every dish row of every
+# keyword sheet, the run is written as three tables:
+#   Restaurants     one row per restaurant, keyed by a stable Restaurant ID
+#   Dishes          one row per (dish, restaurant) across all keywords
+#   Keyword Matches which keywords found which dishes (Keyword, Dish ID)
+
+RESTAURANT_COLUMNS = [
+    "Restaurant ID",
+    "Restaurant Name",
+    "Average Rating",
+    "Total Ratings",
+    "Locality",
+    "Area Name",
+    "Cuisine",
+    "costForTwoMessage",
+    "Discount",
+    "Discount Details",
+    "Discount Type",
+]
+DISH_COLUMNS = ["Dish ID", "Dish Name", "Restaurant ID", "Rating", "Price (₹)", "Category", "Description"]
+MATCH_COLUMNS = ["Keyword", "Dish ID"]
+
+# Restaurant fields hashed into an ID when the API did not send one
+RESTAURANT_ID_FALLBACK_COLUMNS = ["Restaurant Name", "Locality", "Area Name"]
+# Per-keyword dedup key: one row per dish per outlet (the fallback columns stand in for a missing ID)
+KEY_COLUMNS = ["Dish Name", "Restaurant ID", *RESTAURANT_ID_FALLBACK_COLUMNS]
+
+
+def stable_restaurant_id(api_id, name, locality, area_name):
+    """Swiggy's restaurant id when present, otherwise a short hash of the restaurant's identity"""
+    if api_id not in (None, "", "N/A") and not pd.isna(api_id):
+        return str(api_id)
+    identity = "|".join(str(value) for value in (name, locality, area_name))
+    return "h" + hashlib.sha1(identity.encode("utf-8")).hexdigest()[:12]
+
+
+class NormalizedTables:
+    """Accumulates every keyword's rows into restaurant, dish and keyword-match tables"""
+
+    def __init__(self):
+        self._restaurants = {}  # Restaurant ID -> restaurant row (first seen wins)
+        self._dish_ids = {}  # (Dish Name, Restaurant ID) -> Dish ID
+        self._dishes = {column: [] for column in DISH_COLUMNS}
+        self._matches = {column: [] for column in MATCH_COLUMNS}
+        self.raw_rows = 0
+
+    def add_query(self, query, df):
+        """Adds one keyword's (already per-keyword deduplicated) wide DataFrame"""
+        self.raw_rows += len(df)
+        restaurant_ids = [
+            stable_restaurant_id(*values)
+            for values in zip(df["Restaurant ID"], *(df[column] for column in RESTAURANT_ID_FALLBACK_COLUMNS))
+        ]
+
+        # Dish attributes other than the two ID columns, in DISH_COLUMNS order
+        dish_value_columns = [column for column in DISH_COLUMNS if column not in ("Dish ID", "Restaurant ID")]
+        restaurant_rows = zip(*(df[column] for column in RESTAURANT_COLUMNS[1:]))
+        dish_rows = zip(*(df[column] for column in dish_value_columns))
+
+        for restaurant_id, restaurant_row, dish_row in zip(restaurant_ids, restaurant_rows, dish_rows):
+            if restaurant_id not in self._restaurants:
+                self._restaurants[restaurant_id] = (restaurant_id, *restaurant_row)
+
+            dish_key = (dish_row[0], restaurant_id)  # (Dish Name, Restaurant ID)
+            dish_id = self._dish_ids.get(dish_key)
+            if dish_id is None:
+                dish_id = len(self._dish_ids) + 1
+                self._dish_ids[dish_key] = dish_id
+                self._dishes["Dish ID"].append(dish_id)
+                self._dishes["Restaurant ID"].append(restaurant_id)
+                for column, value in zip(dish_value_columns, dish_row):
+                    self._dishes[column].append(value)
+
+            self._matches["Keyword"].append(query)
+            self._matches["Dish ID"].append(dish_id)
+
+    def tables(self):
+        """Returns {sheet name: DataFrame} for the Restaurants, Dishes and Keyword Matches tables"""
+        return {
+            "Restaurants": pd.DataFrame(list(self._restaurants.values()), columns=RESTAURANT_COLUMNS),
+            "Dishes": pd.DataFrame(self._dishes, columns=DISH_COLUMNS),
+            "Keyword Matches": pd.DataFrame(self._matches, columns=MATCH_COLUMNS),
+        }
+
+    def summary(self):
+        return {
+            "restaurants": len(self._restaurants),
+            "dishes": len(self._dish_ids),
+            "matches": len(self._matches["Keyword"]),
+            "raw_rows": self.raw_rows,
+        }
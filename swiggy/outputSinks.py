@@ -0,0 +1,221 @@
+import os
+from urllib.parse import quote
+
+import pandas as pd
+
+from .columnWidths import FIXED_COLUMN_WIDTHS, ColumnWidthSizer, apply_column_widths
+
+# Pluggable output sinks for a sweep.
+#
+# Every sink takes finished tables through write_sheet(name, df) and returns the
+# files it produced from close(); sinks that finish a file per table also return
+# that file from write_sheet(), so it can be uploaded while the sweep goes on. Parquet (hive-partitioned by run timestamp and
+# query) and Arrow IPC are the columnar formats; the Excel workbook can either be
+# written directly (optionally streamed sheet by sheet with a write-only
+# workbook) or exported afterwards from the columnar data.
+#
+# pyarrow is only needed when a columnar sink is used.
+
+FORMAT_EXCEL = "excel"
+FORMAT_PARQUET = "parquet"
+FORMAT_ARROW = "arrow"
+COLUMNAR_ROOT = "SwiggyData"  # Local folder for the Parquet / Arrow datasets
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.feather
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("Parquet/Arrow output needs pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+class ExcelSink:
+    """Writes each table as a sheet of one workbook (the original output format)"""
+    format = FORMAT_EXCEL
+
+    def __init__(self, output_path, fixed_widths=True):
+        self.output_path = output_path
+        # Fixed keyword-sheet layout, or auto-sized columns
+        self.sizer = ColumnWidthSizer(FIXED_COLUMN_WIDTHS if fixed_widths else None)
+        self.tables_written = 0
+        self._writer = pd.ExcelWriter(output_path, engine="openpyxl")
+
+    def write_sheet(self, name, df):
+        sheet_name = name[:31]  # Excel sheet name limit is 31 characters
+        df.to_excel(self._writer, sheet_name=sheet_name, index=False)
+        apply_column_widths(self._writer.sheets[sheet_name], self.sizer.widths(df))
+        self.tables_written += 1
+
+    def close(self):
+        if not self.tables_written:
+            return []  # Nothing to save (openpyxl cannot save an empty workbook)
+        self._writer.close()
+        return [self.output_path]
+
+
+def _excel_value(value):
+    """Converts a DataFrame value to what openpyxl writes (missing values become empty cells)"""
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return value
+
+
+class StreamingExcelSink:
+    """
+    Writes each table as a sheet of a write-only openpyxl workbook.
+
+    Rows are streamed to a temporary file per sheet as soon as the table is
+    written, so memory no longer grows with every finished keyword; the sheets
+    are only zipped into the final workbook on close().
+    """
+    format = FORMAT_EXCEL
+
+    def __init__(self, output_path, fixed_widths=True):
+        from openpyxl import Workbook
+
+        self.output_path = output_path
+        self.sizer = ColumnWidthSizer(FIXED_COLUMN_WIDTHS if fixed_widths else None)
+        self.tables_written = 0
+        self._workbook = Workbook(write_only=True)
+
+    def write_sheet(self, name, df):
+        sheet = self._workbook.create_sheet(title=name[:31])  # Excel sheet name limit is 31 characters
+
+        # Column widths must be set before the first row is streamed out
+        apply_column_widths(sheet, self.sizer.widths(df))
+
+        sheet.append(list(df.columns))
+        for row in df.itertuples(index=False, name=None):
+            sheet.append([_excel_value(value) for value in row])
+        self.tables_written += 1
+
+    def close(self):
+        if not self.tables_written:
+            return []
+        self._workbook.save(self.output_path)
+        return [self.output_path]
+
+
+class ParquetSink:
+    """Writes each table to <root>/parquet/run=<timestamp>/<partition_key>=<name>/part-0.parquet"""
+    format = FORMAT_PARQUET
+
+    def __init__(self, timestamp, root=COLUMNAR_ROOT, partition_key="query", compression="zstd"):
+        _require_pyarrow()
+        self.run_dir = os.path.join(root, "parquet", f"run={timestamp}")
+        self.partition_key = partition_key
+        self.compression = compression
+        self.tables_written = 0
+        self._files = []  # (table name, path) in write order
+
+    def write_sheet(self, name, df):
+        import pyarrow
+        import pyarrow.parquet
+
+        partition_dir = os.path.join(self.run_dir, f"{self.partition_key}={quote(name, safe='')}")
+        os.makedirs(partition_dir, exist_ok=True)
+        file_path = os.path.join(partition_dir, "part-0.parquet")
+
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        pyarrow.parquet.write_table(table, file_path, compression=self.compression)
+        self._files.append((name, file_path))
+        self.tables_written += 1
+        return file_path
+
+    def read_tables(self):
+        """Yields (name, DataFrame) for every table written, in write order"""
+        import pyarrow.parquet
+
+        for name, file_path in self._files:
+            yield name, pyarrow.parquet.read_table(file_path).to_pandas()
+
+    def close(self):
+        return [file_path for _, file_path in self._files]
+
+
+class ArrowSink:
+    """Writes each table as an Arrow IPC (Feather v2) file under <root>/arrow/run=<timestamp>/"""
+    format = FORMAT_ARROW
+
+    def __init__(self, timestamp, root=COLUMNAR_ROOT, compression="lz4"):
+        _require_pyarrow()
+        self.run_dir = os.path.join(root, "arrow", f"run={timestamp}")
+        self.compression = compression
+        self.tables_written = 0
+        self._files = []
+
+    def write_sheet(self, name, df):
+        import pyarrow
+        import pyarrow.feather
+
+        os.makedirs(self.run_dir, exist_ok=True)
+        file_path = os.path.join(self.run_dir, f"{quote(name, safe='')}.arrow")
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        pyarrow.feather.write_feather(table, file_path, compression=self.compression)
+        self._files.append((name, file_path))
+        self.tables_written += 1
+        return file_path
+
+    def read_tables(self):
+        """Yields (name, DataFrame) for every table written, in write order"""
+        import pyarrow.feather
+
+        for name, file_path in self._files:
+            yield name, pyarrow.feather.read_table(file_path).to_pandas()
+
+    def close(self):
+        return [file_path for _, file_path in self._files]
+
+
+def artifact_name(file_path, root=COLUMNAR_ROOT):
+    """Remote name of an output file: its path below the columnar root (e.g. parquet/run=.../query=.../part-0.parquet)"""
+    relative_path = os.path.relpath(file_path, root)
+    if relative_path.startswith(os.pardir):
+        relative_path = os.path.basename(file_path)  # Not below the root (e.g. the workbook)
+    return relative_path.replace(os.sep, "/")
+
+
+def _excel_sink(output_path, fixed_widths, streaming):
+    sink_class = StreamingExcelSink if streaming else ExcelSink
+    return sink_class(output_path, fixed_widths=fixed_widths)
+
+
+def create_sinks(formats, timestamp, excel_path, partition_key="query", fixed_widths=True, excel_streaming=False):
+    """
+    Builds the sinks for a list of formats ("excel", "parquet", "arrow").
+
+    When a columnar format is selected, Excel is not written during the sweep but
+    exported from the columnar data at the end (see export_excel), so the sweep
+    itself only pays for the fast writers. excel_streaming selects the
+    write-only StreamingExcelSink.
+    """
+    formats = [fmt.strip().lower() for fmt in formats if fmt.strip()]
+    unknown = set(formats) - {FORMAT_EXCEL, FORMAT_PARQUET, FORMAT_ARROW}
+    if unknown:
+        raise ValueError(f"Unknown output format(s): {', '.join(sorted(unknown))}")
+
+    sinks = []
+    if FORMAT_PARQUET in formats:
+        sinks.append(ParquetSink(timestamp, partition_key=partition_key))
+    if FORMAT_ARROW in formats:
+        sinks.append(ArrowSink(timestamp))
+    if FORMAT_EXCEL in formats and not sinks:
+        sinks.append(_excel_sink(excel_path, fixed_widths, excel_streaming))
+    return sinks
+
+
+def export_excel(columnar_sink, output_path, fixed_widths=True, streaming=False):
+    """Generates the Excel workbook from a Parquet/Arrow sink's tables; returns its path (or None)"""
+    excel_sink = _excel_sink(output_path, fixed_widths, streaming)
+    for name, df in columnar_sink.read_tables():
+        excel_sink.write_sheet(name, df)
+    written = excel_sink.close()
+    return written[0] if written else None
@@ -0,0 +1,438 @@
+import datetime
+import mimetypes
+import os
+
+import pandas as pd
+
+from . import columnBuffer
+from . import deltaSnapshot
+from . import dishExtractor
+from . import driveUpload
+from . import fetchEngine
+from . import httpClient
+from . import normalizedOutput
+from . import outputSinks
+from . import priceHistory
+from . import rateLimiter
+from . import responseCache
+from . import sweepCheckpoint
+from . import sweepConfig
+from . import transports
+from . import uploadPipeline
+from .textCleaning import clean_dataframe
+
+# The scraping pipeline as a library: fetch / parse / write building blocks and
+# run(), which performs a whole keyword × location sweep.
+#
+# Nothing happens at import time: no files are read, no folders created and no
+# connections opened until a function is called. Google Drive (googleapiclient),
+# openpyxl and pyarrow are only imported by the features that use them.
+
+DEFAULT_BASE_URL = "https://www.swiggy.com"
+MAX_CONCURRENCY = 8  # Number of (query, location) requests in flight at once
+GOOGLE_DRIVE_FOLDER_ID = "1gmh07ZHRImVHe-icxgeJryV7w3SKPNYK"  # Replace with actual folder ID from Google Drive
+SAVE_PATH = "D:/SwiggyData/"  # Modify this to your preferred folder
+
+OUTPUT_MODE_WIDE = "wide"
+OUTPUT_MODE_NORMALIZED = "normalized"
+OUTPUT_MODE_DELTA = "delta"
+
+# Key that identifies a duplicate dish across locations
+DEDUP_COLUMNS = ["Dish Name", "Restaurant Name"]
+
+# Built once: projects DISH cards straight into column buffers
+dish_extractor = dishExtractor.DishExtractor(dishExtractor.DISH_FIELDS)
+
+
+class SweepOptions:
+    """Settings of one sweep (defaults match the original script)"""
+
+    def __init__(self, keywords_path=sweepConfig.KEYWORDS_PATH, locations_path=sweepConfig.LOCATIONS_PATH,
+                 base_url=DEFAULT_BASE_URL, max_concurrency=MAX_CONCURRENCY, cache_mode=responseCache.MODE_READ_WRITE,
+                 output_mode=OUTPUT_MODE_WIDE, output_formats=(outputSinks.FORMAT_EXCEL,), excel_streaming=False,
+                 record_history=True, upload=True, drive_folder_id=GOOGLE_DRIVE_FOLDER_ID,
+                 drive_endpoint=None, upload_chunk_size=driveUpload.CHUNK_SIZE, save_path=SAVE_PATH,
+                 transport=transports.TRANSPORT_HTTP):
+        self.keywords_path = keywords_path
+        self.locations_path = locations_path
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.cache_mode = cache_mode
+        self.output_mode = output_mode
+        self.output_formats = list(output_formats)
+        self.excel_streaming = excel_streaming
+        self.record_history = record_history
+        self.upload = upload
+        self.drive_folder_id = drive_folder_id
+        self.drive_endpoint = drive_endpoint
+        self.upload_chunk_size = upload_chunk_size
+        self.save_path = save_path
+        self.transport = transport
+
+    @classmethod
+    def from_env(cls, environ=None, **overrides):
+        """
+        Reads the SWIGGY_* environment variables the script has always honoured:
+        SWIGGY_KEYWORDS / SWIGGY_LOCATIONS (.xlsx, .csv, .yaml or .json), SWIGGY_BASE_URL
+        (e.g. a local stubServer), SWIGGY_CACHE_MODE ("readwrite", "offline", "off"),
+        SWIGGY_OUTPUT_MODE ("wide", "normalized", "delta"), SWIGGY_OUTPUT_FORMATS
+        ("excel,parquet,arrow"), SWIGGY_EXCEL_STREAMING, SWIGGY_HISTORY, SWIGGY_UPLOAD,
+        SWIGGY_UPLOAD_CHUNK_MB, SWIGGY_DRIVE_ENDPOINT and SWIGGY_TRANSPORT ("http", "browser",
+        "tiered"). overrides win over the environment.
+        """
+        environ = os.environ if environ is None else environ
+        settings = {
+            "keywords_path": environ.get("SWIGGY_KEYWORDS", sweepConfig.KEYWORDS_PATH),
+            "locations_path": environ.get("SWIGGY_LOCATIONS", sweepConfig.LOCATIONS_PATH),
+            "base_url": environ.get("SWIGGY_BASE_URL", DEFAULT_BASE_URL),
+            "cache_mode": environ.get("SWIGGY_CACHE_MODE", responseCache.MODE_READ_WRITE),
+            "output_mode": environ.get("SWIGGY_OUTPUT_MODE", OUTPUT_MODE_WIDE),
+            "output_formats": environ.get("SWIGGY_OUTPUT_FORMATS", outputSinks.FORMAT_EXCEL).split(","),
+            "excel_streaming": environ.get("SWIGGY_EXCEL_STREAMING", "0") == "1",
+            "record_history": environ.get("SWIGGY_HISTORY", "1") == "1",
+            "upload": environ.get("SWIGGY_UPLOAD", "1") == "1",
+            "drive_endpoint": environ.get("SWIGGY_DRIVE_ENDPOINT") or None,
+            "upload_chunk_size": int(environ.get("SWIGGY_UPLOAD_CHUNK_MB", "8")) * 1024 * 1024,
+            "transport": environ.get("SWIGGY_TRANSPORT", transports.TRANSPORT_HTTP),
+        }
+        settings.update({name: value for name, value in overrides.items() if value is not None})
+        return cls(**settings)
+
+
+class SwiggyClient:
+    """Fetches search/v3 responses through a transport (HTTP by default) and the response cache"""
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, max_concurrency=MAX_CONCURRENCY, cache=None, rate_limiter=None,
+                 transport=None):
+        self.base_url = base_url.rstrip("/")
+        # Shared keep-alive session with one pooled connection per concurrent request to the API host
+        httpClient.configure(host_pool_sizes={httpClient.host_of(self.base_url): max_concurrency})
+        # Shared pacing for all fetch threads; adapts its rate to 429/5xx responses (a given transport's own limiter wins)
+        self.rate_limiter = rate_limiter or getattr(transport, "rate_limiter", None) or rateLimiter.AdaptiveRateLimiter()
+        self.cache = cache if cache is not None else responseCache.ResponseCache(mode=responseCache.MODE_OFF)
+        # "http", "browser", "tiered" or any object with fetch(url), summary() and close()
+        if transport is None or isinstance(transport, str):
+            transport = transports.create_transport(transport or transports.TRANSPORT_HTTP, self.rate_limiter)
+        self.transport = transport
+
+    def search_url(self, lat, lng, query):
+        # Construct API URL correctly (fixing spaces)
+        return f"{self.base_url}/dapi/restaurants/search/v3?lat={str(lat).strip()}&lng={str(lng).strip()}&str={query.strip().replace(' ', '%20')}&trackingId=undefined&submitAction=ENTER"
+
+    def fetch(self, lat, lng, query):
+        """Fetches and processes data from Swiggy API"""
+
+        # Serve repeated (lat, lng, query) requests from the response cache
+        cached = self.cache.get(lat, lng, query)
+        if cached is not None:
+            return cached
+        if self.cache.offline:
+            print(f"❌ No cached response for {query} at ({lat}, {lng}) (offline mode)")
+            return None
+
+        # Load it through the transport (HTTP: pooled connection, explicit timeouts, paced and retried on 429/5xx)
+        data = self.transport.fetch(self.search_url(lat, lng, query))
+        if data is None:
+            return None  # The transport reported why; the pair stays unjournaled and is retried next run
+
+        if dishExtractor.is_search_result(data):
+            self.cache.put(lat, lng, query, data)  # Error/blocked payloads are refetched next time
+        return data
+
+    def report(self):
+        """Prints connection reuse, throttling and cache statistics"""
+        stats = httpClient.connection_stats()
+        print(f"🔌 HTTP requests: {stats['requests']}, connections opened: {stats['connections']} (reuse {stats['reuse_ratio']:.0%})")
+        if getattr(self.transport, "rate_limiter", None) is not None:  # Browser loads are not paced
+            limiter_stats = self.rate_limiter.stats()
+            print(f"🚦 Throttled/failed attempts: {limiter_stats['errors']}, final rate: {limiter_stats['rate']} req/s")
+        cache_stats = self.cache.stats()
+        print(f"🗄️ Cache hits: {cache_stats['hits']}, misses: {cache_stats['misses']}, entries: {cache_stats['entries']}")
+        transport_summary = self.transport.summary()
+        if transport_summary:
+            print(transport_summary)
+
+    def close(self):
+        self.transport.close()
+        self.cache.close()
+
+
+_default_client = None
+
+
+def fetch(lat, lng, query, client=None):
+    """Fetches one search response (parsed JSON, or None); uses an uncached default client unless one is given"""
+    global _default_client
+    if client is None:
+        if _default_client is None:
+            _default_client = SwiggyClient()
+        client = _default_client
+    return client.fetch(lat, lng, query)
+
+
+def parse(data, query="", all_groups=False):
+    """
+    Extracts the dish and restaurant details from the DISH cards into a column buffer (None when empty).
+
+    Only the first groupedCard is read unless all_groups is set (as AUTOMATE.PY does).
+    Raises ValueError for a response that isn't a search result (an error or
+    blocked payload), so it is never mistaken for "no dishes here".
+    """
+    dish_buffer = columnBuffer.ColumnBuffer(dish_extractor.columns, dishExtractor.DISH_COLUMN_TYPES)
+    dish_extractor.extract(data, all_groups=all_groups, columns=dish_buffer.columns)
+
+    # Hand back this location's rows (None when nothing was found)
+    return dish_buffer if len(dish_buffer) else None
+
+
+def new_query_buffer(key_columns=DEDUP_COLUMNS):
+    """Per-keyword buffer that drops duplicate rows (by dish and restaurant unless key_columns say otherwise) as each location's rows arrive"""
+    return columnBuffer.DedupBuffer(dish_extractor.columns, dishExtractor.DISH_COLUMN_TYPES, key_columns=key_columns)
+
+
+def to_frame(query_buffer):
+    """Builds a keyword's DataFrame from its column buffer, with the column-level conversions applied"""
+    if query_buffer is None or not len(query_buffer):
+        return pd.DataFrame()  # Return empty DataFrame if no data is present
+
+    # Column-level conversions (e.g. "1.3K+" → 1300) on the deduplicated rows only
+    return query_buffer.to_frame(dishExtractor.DISH_COLUMN_CONVERTERS)
+
+
+def parse_frame(data, query=""):
+    """Parses one search response straight into a DataFrame"""
+    return to_frame(parse(data, query))
+
+
+def write(tables, formats=(outputSinks.FORMAT_EXCEL,), excel_path=None, timestamp=None,
+          partition_key="query", fixed_widths=True, excel_streaming=False):
+    """Writes {sheet name: DataFrame} in the given formats; returns the files written"""
+    timestamp = timestamp or datetime.datetime.now().strftime(priceHistory.RUN_TIMESTAMP_FORMAT)
+    excel_path = excel_path or f"SwiggyData-{timestamp}.xlsx"
+    sinks = outputSinks.create_sinks(formats, timestamp, excel_path, partition_key, fixed_widths, excel_streaming)
+    for name, df in tables.items():
+        for sink in sinks:
+            sink.write_sheet(name, df)
+
+    files = [file_path for sink in sinks for file_path in sink.close()]
+    if outputSinks.FORMAT_EXCEL in formats and excel_path not in files and files:
+        exported = outputSinks.export_excel(sinks[0], excel_path, fixed_widths, excel_streaming)
+        if exported:
+            files.append(exported)
+    return files
+
+
+class SweepRun:
+    """One keyword × location sweep: fetch, per-keyword tables, outputs, history and uploads"""
+
+    def __init__(self, options):
+        self.options = options
+        self.search_queries, self.locations = sweepConfig.load_sweep_config(options.keywords_path, options.locations_path)
+
+        # On-disk response cache ("readwrite", "offline" to replay without the network, or "off")
+        cache = responseCache.ResponseCache(responseCache.CACHE_PATH, mode=options.cache_mode)
+        self.client = SwiggyClient(options.base_url, options.max_concurrency, cache, transport=options.transport)
+
+        # Set up output folder and file naming
+        os.makedirs(options.save_path, exist_ok=True)
+        self.started = datetime.datetime.now()
+        self.timestamp = self.started.strftime(priceHistory.RUN_TIMESTAMP_FORMAT)
+        self.excel_path = f"SwiggyData-{self.timestamp}.xlsx"  # Save locally first
+        self.manifest_path = f"SwiggyData-{self.timestamp}-manifest.json"
+
+        mode = options.output_mode
+        self.is_normalized = mode == OUTPUT_MODE_NORMALIZED
+        self.is_delta = mode == OUTPUT_MODE_DELTA
+        self.is_wide = not (self.is_normalized or self.is_delta)
+        self.sinks = outputSinks.create_sinks(
+            options.output_formats,
+            self.timestamp,
+            self.excel_path,
+            partition_key="query" if self.is_wide else "table",
+            fixed_widths=self.is_wide,
+            excel_streaming=options.excel_streaming,
+        )
+
+        # Finished output files are uploaded on a background thread while the sweep continues
+        self.uploader = uploadPipeline.BackgroundUploader(self.upload_to_drive) if options.upload else None
+
+        # Resume from the checkpoint journal if a previous run did not finish
+        self.checkpoint = sweepCheckpoint.SweepCheckpoint(sweepCheckpoint.CHECKPOINT_PATH, dishExtractor.DISH_COLUMN_TYPES,
+                                                          columns=dish_extractor.columns)
+        if len(self.checkpoint):
+            print(f"♻️ Resuming sweep: {len(self.checkpoint)} keyword/location pairs already done")
+
+        # Restaurant/dish tables shared by all keywords (normalized output mode)
+        self.normalized_tables = normalizedOutput.NormalizedTables()
+        # Rows of the whole run, diffed against the previous snapshot at the end (delta output mode)
+        self.delta_tracker = deltaSnapshot.DeltaTracker()
+        # Every keyword's rows, appended to the price history once the sweep is done
+        self.history_tables = {}
+
+    def upload_to_drive(self, file_path, name=None):
+        """Uploads the file to Google Drive in a specific folder (resumable, chunked, retried); returns its file ID."""
+        service = driveUpload.get_drive_service(driveUpload.SERVICE_ACCOUNT_FILE, api_endpoint=self.options.drive_endpoint)
+        mimetype = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        return driveUpload.upload_file(file_path, self.options.drive_folder_id, mimetype=mimetype,
+                                       chunk_size=self.options.upload_chunk_size,
+                                       progress=driveUpload.milestone_progress(), service=service, name=name)
+
+    def write_sheet(self, name, df):
+        """Writes a table to every sink and queues any file that is already complete for upload"""
+        for sink in self.sinks:
+            artifact = sink.write_sheet(name, df)
+            if artifact and self.uploader is not None:
+                self.uploader.submit(artifact, outputSinks.artifact_name(artifact))
+
+    def add_query(self, query, query_buffer):
+        """Handles one keyword's rows (deduplicated across its locations)"""
+        df_final = to_frame(query_buffer)
+        if len(query_buffer):
+            print(f"   🧮 {len(query_buffer)} unique dishes from {query_buffer.raw_rows} results")
+        if self.options.record_history and not df_final.empty:
+            self.history_tables[query] = df_final
+
+        if self.is_normalized:
+            if df_final.empty:
+                print(f"   ❌ No data found for {query}")
+            else:
+                self.normalized_tables.add_query(query, df_final)
+            return
+
+        # Restaurant ID is only used by the normalized tables
+        df_final = df_final.drop(columns=["Restaurant ID"], errors="ignore")
+
+        # Save cleaned data
+        if not df_final.empty:
+            df_final, cleaned_cells = clean_dataframe(df_final)  # Clean text for Excel compatibility
+            if cleaned_cells:
+                print(f"   🧹 Removed control characters from {cleaned_cells} cells")
+            if self.is_delta:
+                self.delta_tracker.add_query(query, df_final)
+            else:
+                self.write_sheet(query, df_final)
+        else:
+            print(f"   ❌ No data found for {query}")
+
+    def is_complete(self):
+        return self.checkpoint.is_complete(self.search_queries, self.locations)
+
+    def write_run_tables(self):
+        """Writes the run-wide normalized or delta tables"""
+        if self.is_normalized and self.normalized_tables.raw_rows:
+            for table_name, table_df in self.normalized_tables.tables().items():
+                table_df, _ = clean_dataframe(table_df)
+                self.write_sheet(table_name, table_df)
+            summary = self.normalized_tables.summary()
+            print(f"\n🗂️ Normalized {summary['raw_rows']} keyword rows into {summary['restaurants']} restaurants and {summary['dishes']} dishes")
+
+        # Write only what changed since the previous run (the snapshot is replaced once the outputs are saved)
+        if self.is_delta:
+            for table_name, table_df in self.delta_tracker.finish(complete=self.is_complete()).items():
+                self.write_sheet(table_name, table_df)
+            summary = self.delta_tracker.summary()
+            print(f"\n🔁 Delta vs previous snapshot ({summary['previous']} dishes): {summary['inserts']} inserts, {summary['updates']} updates, {summary['deletes']} deletes")
+
+    def save_history(self, complete):
+        """
+        Appends the run to the price/rating history once its outputs are saved.
+
+        An incomplete sweep is skipped: the rerun that completes it replays the
+        journaled rows, so ingesting them now would record them twice.
+        """
+        if not self.history_tables:
+            return
+        if not complete:
+            print("⏸️ Price history is recorded once the sweep completes")
+            return
+        history_rows = priceHistory.HistoryStore().ingest_tables(self.history_tables, self.started)
+        print(f"📈 Added {history_rows} rows to the price history ({priceHistory.HISTORY_ROOT})")
+
+    def finish_checkpoint(self):
+        """Drops the journal once every pair is done; keeps it so failed pairs are retried next run"""
+        if self.is_complete():
+            self.checkpoint.finish()
+        else:
+            self.checkpoint.close()
+            print(f"⚠️ Some keyword/location pairs failed; rerun to retry them (progress kept in {self.checkpoint.path})")
+
+    def save_outputs(self):
+        """Closes the sinks and exports Excel from the columnar data if needed; returns (files, excel path)"""
+        output_files = []
+        for sink in self.sinks:
+            output_files.extend(sink.close())
+
+        # Excel as an optional export generated from the columnar data
+        excel_path = self.excel_path if os.path.exists(self.excel_path) else None
+        if outputSinks.FORMAT_EXCEL in self.options.output_formats and excel_path is None and output_files:
+            excel_path = outputSinks.export_excel(self.sinks[0], self.excel_path, fixed_widths=self.is_wide,
+                                                  streaming=self.options.excel_streaming)
+        return output_files, excel_path
+
+    def finish_uploads(self):
+        """Waits for the background uploads, then records what reached Drive in one manifest"""
+        if self.uploader is None:
+            return None
+        if not self.uploader.entries:
+            self.uploader.close()
+            return None
+
+        self.uploader.write_manifest(self.manifest_path, run=self.timestamp, folder_id=self.options.drive_folder_id,
+                                     output_mode=self.options.output_mode)
+        upload_summary = self.uploader.summary()
+        print(f"🧾 Manifest saved locally: {self.manifest_path} ({upload_summary['uploaded']} uploaded, {upload_summary['failed']} failed)")
+        try:
+            self.upload_to_drive(self.manifest_path)
+            print(f"✅ Manifest uploaded: {self.manifest_path}")
+        except Exception as e:
+            print(f"❌ Manifest upload failed: {e}")
+        return self.manifest_path
+
+    def new_query_buffer(self):
+        # Delta and normalized tables are per outlet, so every outlet of a chain has to survive dedup
+        if self.is_delta:
+            return new_query_buffer(deltaSnapshot.KEY_COLUMNS)
+        if self.is_normalized:
+            return new_query_buffer(normalizedOutput.KEY_COLUMNS)
+        return new_query_buffer(DEDUP_COLUMNS)
+
+    def run(self):
+        """Runs the sweep; returns {"output_files", "excel_path", "manifest_path", "complete"}"""
+        # Fetch every keyword × location pair concurrently; results arrive per keyword, in order
+        for query, query_buffer in fetchEngine.sweep(self.search_queries, self.locations, self.client.fetch, parse,
+                                                     max_concurrency=self.options.max_concurrency,
+                                                     checkpoint=self.checkpoint, accumulator_factory=self.new_query_buffer):
+            print(f"\n🔍 Results for: {query}")
+            self.add_query(query, query_buffer)
+
+        self.write_run_tables()
+
+        # Report how well the keep-alive pool reused connections
+        self.client.report()
+        self.client.close()
+
+        complete = self.is_complete()
+        output_files, excel_path = self.save_outputs()
+        # Only now that the delta tables are on disk may the next run diff against this one
+        if self.is_delta:
+            self.delta_tracker.commit()
+        self.save_history(complete)
+        if output_files:
+            for file_path in output_files:
+                print(f"✅ Saved locally: {file_path}")
+            if excel_path:
+                print(f"✅ Excel file saved locally: {excel_path}")
+            self.finish_checkpoint()
+            if excel_path and self.uploader is not None:
+                self.uploader.submit(excel_path)  # Upload to Google Drive
+        else:
+            self.finish_checkpoint()
+            print("⚠️ No data found. Skipping upload.")
+
+        manifest_path = self.finish_uploads()
+        return {"output_files": output_files, "excel_path": excel_path, "manifest_path": manifest_path, "complete": complete}
+
+
+def run(options=None):
+    """Runs a full sweep (settings from the SWIGGY_* environment unless options are given)"""
+    return SweepRun(options or SweepOptions.from_env()).run()
@@ -0,0 +1,185 @@
+import datetime
+import glob
+import os
+import re
+import sys
+
+import pandas as pd
+
+from .dishExtractor import convert_total_ratings_series
+
+# Append-only price/rating history across runs.
+#
+# Every run's rows are appended to a Parquet dataset partitioned by day:
+#     SwiggyData/history/day=2025-03-07/run=2025-03-07_18-49-04.parquet
+# Files are never rewritten; ingesting a run that is already stored is a no-op,
+# so old SwiggyData-*.xlsx workbooks can be backfilled at any time. Rows are
+# sorted by restaurant and dish, so Parquet row-group statistics let a query
+# like "price history of dish X at restaurant Y" skip most of each file, and a
+# time range only opens the matching day partitions.
+#
+#     python -m swiggy.priceHistory ingest SwiggyData-*.xlsx
+#     python -m swiggy.priceHistory history "French Fries" "McDonald's" [2025-03-01] [2025-03-31]
+
+HISTORY_ROOT = os.path.join("SwiggyData", "history")
+RUN_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
+WORKBOOK_PATTERN = re.compile(r"SwiggyData-(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})\.xlsx$")
+ROW_GROUP_SIZE = 8192
+
+# Stored columns and their types; columns a run doesn't have are stored as nulls
+HISTORY_COLUMNS = {
+    "Observed At": "timestamp[s]",
+    "Keyword": "string",
+    "Dish Name": "string",
+    "Restaurant Name": "string",
+    "Restaurant ID": "string",
+    "Locality": "string",
+    "Area Name": "string",
+    "Category": "string",
+    "Price (₹)": "float64",
+    "Rating": "float64",
+    "Average Rating": "float64",
+    "Total Ratings": "int64",
+    "Discount": "string",
+    "Discount Details": "string",
+    "Discount Type": "string",
+    "costForTwoMessage": "string",
+}
+SORT_COLUMNS = ["Restaurant Name", "Dish Name", "Locality"]
+HISTORY_VIEW_COLUMNS = ["Observed At", "Price (₹)", "Rating", "Total Ratings", "Discount", "Locality", "Keyword"]
+
+
+def _schema():
+    import pyarrow
+
+    return pyarrow.schema([(column, pyarrow.type_for_alias(type_name)) for column, type_name in HISTORY_COLUMNS.items()])
+
+
+def run_timestamp_from_path(file_path):
+    """Parses the run time out of a SwiggyData-<timestamp>.xlsx file name (None if it doesn't match)"""
+    match = WORKBOOK_PATTERN.search(os.path.basename(file_path))
+    return datetime.datetime.strptime(match.group(1), RUN_TIMESTAMP_FORMAT) if match else None
+
+
+def _history_frame(tables, observed_at):
+    """Stacks {keyword: DataFrame} into one frame with the HISTORY_COLUMNS layout"""
+    frames = [df.assign(Keyword=keyword) for keyword, df in tables.items() if not df.empty]
+    if not frames:
+        return None
+    df = pd.concat(frames, ignore_index=True)
+
+    columns = {}
+    for column, type_name in HISTORY_COLUMNS.items():
+        if column == "Observed At":
+            continue
+        values = df[column] if column in df.columns else pd.Series(None, index=df.index, dtype="object")
+        if column == "Total Ratings" and not pd.api.types.is_numeric_dtype(values):
+            values = convert_total_ratings_series(values)
+        elif type_name in ("float64", "int64"):
+            values = pd.to_numeric(values, errors="coerce")  # "N/A" becomes null
+        else:
+            values = values.astype("string")
+        columns[column] = values
+    history = pd.DataFrame({"Observed At": pd.Timestamp(observed_at).floor("s"), **columns})
+    return history.sort_values(SORT_COLUMNS, kind="stable", ignore_index=True)
+
+
+class HistoryStore:
+    """Day-partitioned, append-only Parquet history of every ingested run"""
+
+    def __init__(self, root=HISTORY_ROOT):
+        self.root = root
+
+    def run_path(self, observed_at):
+        return os.path.join(
+            self.root,
+            f"day={observed_at:%Y-%m-%d}",
+            f"run={observed_at.strftime(RUN_TIMESTAMP_FORMAT)}.parquet",
+        )
+
+    def has_run(self, observed_at):
+        return os.path.exists(self.run_path(observed_at))
+
+    def ingest_tables(self, tables, observed_at):
+        """Appends one run ({keyword: DataFrame}); returns the rows written (0 if empty or already stored)"""
+        import pyarrow
+        import pyarrow.parquet
+
+        file_path = self.run_path(observed_at)
+        if os.path.exists(file_path):
+            return 0
+        df = _history_frame(tables, observed_at)
+        if df is None:
+            return 0
+
+        table = pyarrow.Table.from_pandas(df, schema=_schema(), preserve_index=False)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        temp_path = file_path + ".tmp"
+        pyarrow.parquet.write_table(table, temp_path, compression="zstd", row_group_size=ROW_GROUP_SIZE)
+        os.replace(temp_path, file_path)  # A run is either fully stored or not at all
+        return len(df)
+
+    def ingest_workbook(self, file_path):
+        """Backfills a SwiggyData-<timestamp>.xlsx workbook (one sheet per keyword); returns rows written"""
+        observed_at = run_timestamp_from_path(file_path)
+        if observed_at is None:
+            raise ValueError(f"Cannot read the run time from {file_path} (expected SwiggyData-<YYYY-MM-DD_HH-MM-SS>.xlsx)")
+        if os.path.getsize(file_path) == 0 or self.has_run(observed_at):
+            return 0  # Empty workbook (aborted run) or already ingested
+        return self.ingest_tables(pd.read_excel(file_path, sheet_name=None), observed_at)
+
+    def _dataset(self):
+        import pyarrow
+        import pyarrow.dataset
+
+        partitioning = pyarrow.dataset.partitioning(pyarrow.schema([("day", pyarrow.string())]), flavor="hive")
+        return pyarrow.dataset.dataset(self.root, format="parquet", partitioning=partitioning,
+                                       schema=_schema().append(pyarrow.field("day", pyarrow.string())),
+                                       exclude_invalid_files=True)
+
+    def query(self, start=None, end=None, columns=None, **equals):
+        """
+        Returns the stored rows between start and end (dates or datetimes, inclusive)
+        whose columns match equals (e.g. query(**{"Dish Name": "Fries"})), oldest first.
+        """
+        import pyarrow.dataset as ds
+
+        if not os.path.isdir(self.root):
+            return pd.DataFrame(columns=columns or list(HISTORY_COLUMNS))
+
+        expression = None
+        conditions = [ds.field(column) == value for column, value in equals.items()]
+        if start is not None:
+            start = pd.Timestamp(start)
+            conditions += [ds.field("day") >= f"{start:%Y-%m-%d}", ds.field("Observed At") >= start.to_pydatetime()]
+        if end is not None:
+            end = pd.Timestamp(end)
+            if end == end.normalize():
+                end = end + pd.Timedelta(days=1) - pd.Timedelta(seconds=1)  # A bare date includes that whole day
+            conditions += [ds.field("day") <= f"{end:%Y-%m-%d}", ds.field("Observed At") <= end.to_pydatetime()]
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+
+        table = self._dataset().to_table(columns=columns or list(HISTORY_COLUMNS), filter=expression)
+        return table.to_pandas().sort_values("Observed At", kind="stable", ignore_index=True)
+
+    def price_history(self, dish_name, restaurant_name, start=None, end=None):
+        """Price/rating observations of one dish at one restaurant, oldest first"""
+        return self.query(start, end, columns=HISTORY_VIEW_COLUMNS,
+                          **{"Dish Name": dish_name, "Restaurant Name": restaurant_name})
+
+
+if __name__ == "__main__":
+    store = HistoryStore()
+    command = sys.argv[1] if len(sys.argv) > 1 else "ingest"
+
+    if command == "ingest":
+        paths = sys.argv[2:] or sorted(glob.glob("SwiggyData-*.xlsx"))
+        for path in paths:
+            rows = store.ingest_workbook(path)
+            print(f"📥 {path}: {rows} rows" if rows else f"⏭️ {path}: empty or already ingested")
+    elif command == "history" and len(sys.argv) >= 4:
+        history = store.price_history(sys.argv[2], sys.argv[3], *sys.argv[4:6])
+        print(history.to_string(index=False) if not history.empty else "⚠️ No history for that dish")
+    else:
+        print('Usage: python -m swiggy.priceHistory ingest [SwiggyData-*.xlsx ...] | history "<dish>" "<restaurant>" [start] [end]')
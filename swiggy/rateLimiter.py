@@ -0,0 +1,148 @@
+import collections
+import email.utils
+import random
+import threading
+import time
+
+import requests
+
+# Shared, self-tuning request pacing for the Swiggy API.
+#
+# A token bucket spaces requests out across all fetch threads. Throttled (429)
+# and server error (5xx) responses are retried with jittered exponential backoff,
+# honour Retry-After, and pull the bucket's rate down when the recent error rate
+# climbs; a clean run of successes slowly raises it again (AIMD), so the sweep
+# settles at the highest rate the API tolerates.
+
+INITIAL_RATE = 4.0  # Requests per second to start with
+MIN_RATE = 0.5  # Never slow down below this
+MAX_RATE = 20.0  # Never speed up beyond this
+BURST = 4  # Tokens that may accumulate while idle
+MAX_RETRIES = 5  # Retries per request on 429/5xx or connection errors
+BACKOFF_BASE = 1.0  # Seconds; doubled on every retry
+BACKOFF_CAP = 60.0  # Upper bound for a single backoff
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value):
+    """Returns the Retry-After header value in seconds (delta-seconds or HTTP date), or None"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """Full-jitter exponential backoff: a random delay in [0, min(cap, base * 2^attempt)]"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe token bucket whose rate adapts to the observed error rate"""
+
+    def __init__(self, rate=INITIAL_RATE, min_rate=MIN_RATE, max_rate=MAX_RATE, burst=BURST,
+                 window=50, error_threshold=0.05, increase_step=0.25, decrease_factor=0.5):
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.error_threshold = error_threshold  # Error share in the window that triggers a slowdown
+        self.increase_step = increase_step  # Requests/second added after a clean window
+        self.decrease_factor = decrease_factor  # Rate multiplier applied on a slowdown
+
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0  # Set from Retry-After; blocks every thread
+        self._outcomes = collections.deque(maxlen=window)  # True = error
+        self._since_adjust = 0
+        self._lock = threading.Lock()
+
+        self.successes = 0
+        self.errors = 0
+
+    def acquire(self):
+        """Blocks until a request may be sent"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            time.sleep(wait)
+
+    def record_success(self):
+        with self._lock:
+            self.successes += 1
+            self._record(False)
+
+    def record_error(self, retry_after=None):
+        """Records a throttled/failed request; retry_after (seconds) pauses all requests"""
+        with self._lock:
+            self.errors += 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._record(True)
+
+    def _record(self, is_error):
+        """Adjusts the rate once enough outcomes have been seen since the last change"""
+        self._outcomes.append(is_error)
+        self._since_adjust += 1
+
+        error_rate = sum(self._outcomes) / len(self._outcomes)
+        if is_error and error_rate > self.error_threshold and self._since_adjust >= self.rate:
+            # Multiplicative decrease, at most about once per second's worth of requests
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._since_adjust = 0
+            self._tokens = min(self._tokens, 1.0)
+        elif not is_error and self._since_adjust >= self._outcomes.maxlen and error_rate <= self.error_threshold:
+            # Additive increase after a clean window
+            self.rate = min(self.max_rate, self.rate + self.increase_step)
+            self._since_adjust = 0
+
+    def stats(self):
+        with self._lock:
+            return {"rate": round(self.rate, 2), "successes": self.successes, "errors": self.errors}
+
+
+def request_with_backoff(limiter, send, max_retries=MAX_RETRIES):
+    """
+    Paces send() through the limiter and retries 429/5xx responses and connection errors.
+
+    Returns the final response (which may still be an error after max_retries),
+    or None when every attempt raised a connection error.
+    """
+    response = None
+    for attempt in range(max_retries + 1):
+        limiter.acquire()
+        try:
+            response = send()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            limiter.record_error()
+            if attempt == max_retries:
+                print(f"❌ Request failed after {max_retries + 1} attempts: {e}")
+                return None
+            time.sleep(backoff_delay(attempt))
+            continue
+
+        if response.status_code not in RETRY_STATUS_CODES:
+            limiter.record_success()
+            return response
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        limiter.record_error(retry_after)
+        if attempt < max_retries:
+            time.sleep(max(retry_after or 0.0, backoff_delay(attempt)))
+
+    return response
@@ -0,0 +1,149 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+# Persistent cache of search/v3 responses, keyed by (lat, lng, query).
+#
+# Responses are stored zlib-compressed in a single SQLite file. Entries older
+# than the TTL are not served (they are refetched), but they are only deleted
+# under size pressure: once the cache grows past its size budget, stale entries
+# go first (oldest first), then the least recently used fresh ones. In "offline"
+# mode the cache never touches the network and replays whatever it has,
+# regardless of age.
+
+CACHE_PATH = "swiggy_cache.sqlite"
+CACHE_TTL_SECONDS = 6 * 60 * 60  # Treat responses older than 6 hours as stale
+CACHE_MAX_BYTES = 500 * 1024 * 1024  # Evict least recently used entries beyond 500 MB
+COORDINATE_PRECISION = 5  # Decimal places kept when normalizing lat/lng (~1 m)
+
+MODE_OFF = "off"  # Always hit the network, never store
+MODE_READ_WRITE = "readwrite"  # Serve fresh entries, store new responses
+MODE_OFFLINE = "offline"  # Cache-only replay, never hit the network
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    cache_key TEXT PRIMARY KEY,
+    lat TEXT NOT NULL,
+    lng TEXT NOT NULL,
+    query TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_access ON responses (last_access);
+CREATE INDEX IF NOT EXISTS responses_fetched_at ON responses (fetched_at);
+"""
+
+
+def normalize_key(lat, lng, query):
+    """Normalizes coordinates and query text so equivalent requests share a cache entry"""
+    lat = f"{round(float(str(lat).strip()), COORDINATE_PRECISION):.{COORDINATE_PRECISION}f}"
+    lng = f"{round(float(str(lng).strip()), COORDINATE_PRECISION):.{COORDINATE_PRECISION}f}"
+    query = " ".join(str(query).split()).casefold()
+    return lat, lng, query
+
+
+class ResponseCache:
+    """SQLite-backed response cache with a TTL for serving and size-bounded eviction (stale, then LRU)"""
+
+    def __init__(self, path=CACHE_PATH, ttl_seconds=CACHE_TTL_SECONDS, max_bytes=CACHE_MAX_BYTES, mode=MODE_READ_WRITE):
+        if mode not in (MODE_OFF, MODE_READ_WRITE, MODE_OFFLINE):
+            raise ValueError(f"Unknown cache mode: {mode}")
+
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._total_bytes = 0  # Running total of stored body sizes
+
+
+        if mode != MODE_OFF:
+            # One connection shared by the fetch threads, serialized by the lock
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @property
+    def offline(self):
+        return self.mode == MODE_OFFLINE
+
+    def get(self, lat, lng, query):
+        """Returns the cached response for a request, or None on a miss or stale entry"""
+        if self._conn is None:
+            return None
+
+        cache_key = "|".join(normalize_key(lat, lng, query))
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, fetched_at FROM responses WHERE cache_key = ?", (cache_key,)
+            ).fetchone()
+
+            # Offline replay serves whatever is stored, however old it is
+            if row is None or (not self.offline and now - row[1] > self.ttl_seconds):
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE cache_key = ?", (now, cache_key))
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, lat, lng, query, data):
+        """Stores a response and evicts least recently used entries beyond the size budget"""
+        if self._conn is None or self.offline:
+            return
+
+        lat, lng, query = normalize_key(lat, lng, query)
+        body = zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"))
+        cache_key = "|".join((lat, lng, query))
+        now = time.time()
+        with self._lock:
+            replaced = self._conn.execute("SELECT size FROM responses WHERE cache_key = ?", (cache_key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, lat, lng, query, body, len(body), now, now),
+            )
+            self._total_bytes += len(body) - (replaced[0] if replaced else 0)
+            if self._total_bytes > self.max_bytes:
+                self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        """Drops stale entries (oldest first), then the least recently used ones, until under max_bytes"""
+        stale_before = now - self.ttl_seconds
+        candidates = [
+            ("SELECT cache_key, size FROM responses WHERE fetched_at < ? ORDER BY fetched_at", (stale_before,)),
+            ("SELECT cache_key, size FROM responses WHERE fetched_at >= ? ORDER BY last_access", (stale_before,)),
+        ]
+        evict_keys = []
+        for sql, params in candidates:
+            for cache_key, size in self._conn.execute(sql, params):
+                if self._total_bytes <= self.max_bytes:
+                    break
+                evict_keys.append((cache_key,))
+                self._total_bytes -= size
+        self._conn.executemany("DELETE FROM responses WHERE cache_key = ?", evict_keys)
+
+    def stats(self):
+        """Returns hit/miss counters and the current number of entries and bytes stored"""
+        entries, size = 0, 0
+        if self._conn is not None:
+            with self._lock:
+                entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                size = self._total_bytes
+        return {"hits": self.hits, "misses": self.misses, "entries": entries, "bytes": size}
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,78 @@
+import html
+import json
+import os
+import sys
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# Local stand-in for www.swiggy.com that replays recorded search/v3 responses.
+#
+# Responses are read from RESPONSES_DIR as "<query>.json" (e.g. "French Fries.json"),
+# falling back to "default.json" when a query has no recording. Point the scraper at it with:
+#     python -m swiggy.stubServer recorded_responses 8765
+#     SWIGGY_BASE_URL=http://127.0.0.1:8765 python swiggyAutomation.py
+#
+# With "html" as a third argument the JSON is wrapped in an HTML page's <pre>
+# tag, the way a browser shows it, for the Selenium path (swiggy.browserPool).
+
+RESPONSES_DIR = "recorded_responses"
+SEARCH_PATH = "/dapi/restaurants/search/v3"
+
+
+def load_recorded_response(responses_dir, query):
+    """Returns the recorded JSON body for a query, or None when nothing was recorded"""
+    for file_name in (f"{query.strip()}.json", "default.json"):
+        file_path = os.path.join(responses_dir, file_name)
+        if os.path.exists(file_path):
+            with open(file_path, "rb") as f:
+                return f.read()
+    return None
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves recorded search/v3 responses over keep-alive HTTP/1.1"""
+    protocol_version = "HTTP/1.1"
+    responses_dir = RESPONSES_DIR
+    html = False  # Serve the JSON inside <pre> on an HTML page
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != SEARCH_PATH:
+            self._send(404, json.dumps({"error": "not found"}).encode())
+            return
+
+        query = parse_qs(url.query).get("str", [""])[0]
+        body = load_recorded_response(self.responses_dir, query)
+        if body is None:
+            self._send(404, json.dumps({"error": f"no recording for {query}"}).encode())
+        elif self.html:
+            page = f"<html><head><meta charset=\"utf-8\"></head><body><pre>{html.escape(body.decode('utf-8'))}</pre></body></html>"
+            self._send(200, page.encode("utf-8"), "text/html; charset=utf-8")
+        else:
+            self._send(200, body)
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Keep the console quiet during sweeps
+
+
+def make_server(responses_dir=RESPONSES_DIR, port=0, handler=StubHandler, html=False):
+    """Creates (but does not start) a stub server; port 0 picks a free port"""
+    handler_class = type("BoundStubHandler", (handler,), {"responses_dir": responses_dir, "html": html})
+    return ThreadingHTTPServer(("127.0.0.1", port), handler_class)
+
+
+if __name__ == "__main__":
+    responses_dir = sys.argv[1] if len(sys.argv) > 1 else RESPONSES_DIR
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+    serve_html = len(sys.argv) > 3 and sys.argv[3] == "html"
+
+    server = make_server(responses_dir, port, html=serve_html)
+    print(f"✅ Stub Swiggy server replaying {responses_dir} on http://127.0.0.1:{server.server_port}")
+    server.serve_forever()
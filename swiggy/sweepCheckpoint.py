@@ -0,0 +1,81 @@
+import json
+import os
+
+from .columnBuffer import ColumnBuffer
+from .responseCache import normalize_key
+
+# Append-only journal of finished (query, location) units for resumable sweeps.
+#
+# Every unit that returned a response is written as one JSON line together with
+# its parsed columns, so a crashed or interrupted run can be restarted and only the
+# missing units are fetched again. The journal is removed once the workbook has
+# been saved successfully.
+
+CHECKPOINT_PATH = "swiggy_checkpoint.jsonl"
+
+
+class SweepCheckpoint:
+    """Journal of completed (query, location) units and their parsed columns"""
+
+    def __init__(self, path=CHECKPOINT_PATH, typecodes=None, columns=None):
+        self.path = path
+        self.typecodes = typecodes  # Typed columns to restore as arrays (see ColumnBuffer)
+        self.columns = set(columns) if columns is not None else None  # Expected columns; other units are refetched
+        self._completed = {}  # unit key -> parsed {column: values} (empty when no dishes)
+
+        if os.path.exists(path):
+            self._load()
+        self._journal = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partially written last line from a crash
+                if entry["columns"] and self.columns is not None and set(entry["columns"]) != self.columns:
+                    continue  # Journaled with a different column set (older version)
+                self._completed[normalize_key(entry["lat"], entry["lng"], entry["query"])] = entry["columns"]
+
+    def __len__(self):
+        return len(self._completed)
+
+    def is_done(self, query, lat, lng):
+        """True when this unit finished in an earlier (or the current) run"""
+        return normalize_key(lat, lng, query) in self._completed
+
+    def completed_rows(self, query, lat, lng):
+        """Returns the journaled rows for a finished unit as a ColumnBuffer (None if it had no dishes)"""
+        columns = self._completed.get(normalize_key(lat, lng, query))
+        if not columns:
+            return None
+        return ColumnBuffer.from_dict(columns, self.typecodes)
+
+    def record(self, query, lat, lng, dish_buffer):
+        """Journals a finished unit; dish_buffer is its parsed ColumnBuffer or None when it had no dishes"""
+        columns = {} if dish_buffer is None else dish_buffer.to_dict()
+        self._completed[normalize_key(lat, lng, query)] = columns
+
+        entry = {"query": query, "lat": str(lat), "lng": str(lng), "columns": columns}
+        self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._journal.flush()
+        os.fsync(self._journal.fileno())  # Make sure the unit survives a crash
+
+    def is_complete(self, search_queries, locations):
+        """True when every (query, location) unit of the sweep has been journaled"""
+        return all(
+            self.is_done(query, location["Latitude"], location["Longitude"])
+            for query in search_queries
+            for location in locations
+        )
+
+    def finish(self):
+        """Closes and deletes the journal after the sweep's output has been saved"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self):
+        if not self._journal.closed:
+            self._journal.close()
@@ -0,0 +1,150 @@
+import csv
+import hashlib
+import json
+import math
+import os
+
+# Keyword and location lists for a sweep.
+#
+# The spreadsheets are parsed once and the resulting lists are kept in a small
+# JSON cache next to the working directory. Later runs only stat() the source:
+# same mtime and size means the cached lists are used as they are; a changed
+# mtime with unchanged content (sha256) just refreshes the cache entry; anything
+# else is parsed again. pandas/openpyxl are only imported for .xlsx sources, and
+# .csv, .yaml/.yml and .json sources need neither.
+#
+# Keyword files: the first column of every row (no header), or a YAML/JSON list
+# (or a mapping with a "keywords" list). Location files: one row per location
+# with a header row (Latitude, Longitude, ...), or a YAML/JSON list of mappings
+# (or a mapping with a "locations" list).
+
+KEYWORDS_PATH = "Book2.xlsx"
+LOCATIONS_PATH = "Book1.xlsx"
+CACHE_PATH = "swiggy_config_cache.json"
+CACHE_VERSION = 1
+
+KIND_KEYWORDS = "keywords"
+KIND_LOCATIONS = "locations"
+
+
+def _file_sha256(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _is_missing(value):
+    return value is None or value == "" or (isinstance(value, float) and math.isnan(value))
+
+
+def _number_or_text(value):
+    """CSV cells are text; coordinates and other numbers are returned as numbers"""
+    if not isinstance(value, str):
+        return value
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return int(number) if number.is_integer() and "." not in value and "e" not in value.lower() else number
+
+
+def _read_rows(path, header):
+    """Returns (column names or None, rows as lists) from an .xlsx or .csv file"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".xlsx", ".xlsm", ".xls"):
+        import pandas as pd
+
+        df = pd.read_excel(path, header=0 if header else None)
+        columns = [str(column) for column in df.columns] if header else None
+        rows = [[None if _is_missing(value) else value for value in row] for row in df.itertuples(index=False, name=None)]
+        return columns, rows
+
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        rows = [[_number_or_text(cell.strip()) if cell.strip() else None for cell in row] for row in csv.reader(f) if row]
+    if header:
+        return [str(column) for column in rows[0]] if rows else [], rows[1:]
+    return None, rows
+
+
+def _read_document(path):
+    extension = os.path.splitext(path)[1].lower()
+    with open(path, encoding="utf-8") as f:
+        if extension == ".json":
+            return json.load(f)
+        try:
+            import yaml
+        except ImportError as e:
+            raise RuntimeError("YAML config files need PyYAML (pip install pyyaml)") from e
+        return yaml.safe_load(f)
+
+
+def parse_keywords(path):
+    """Parses a keyword file into a list of search strings"""
+    if os.path.splitext(path)[1].lower() in (".yaml", ".yml", ".json"):
+        document = _read_document(path) or []
+        values = document.get(KIND_KEYWORDS, []) if isinstance(document, dict) else document
+    else:
+        _, rows = _read_rows(path, header=False)
+        values = [row[0] for row in rows if row]
+    return [value if isinstance(value, str) else str(value) for value in values if not _is_missing(value)]
+
+
+def parse_locations(path):
+    """Parses a location file into a list of {column: value} records"""
+    if os.path.splitext(path)[1].lower() in (".yaml", ".yml", ".json"):
+        document = _read_document(path) or []
+        return list(document.get(KIND_LOCATIONS, []) if isinstance(document, dict) else document)
+
+    columns, rows = _read_rows(path, header=True)
+    return [dict(zip(columns, row)) for row in rows if any(not _is_missing(value) for value in row)]
+
+
+_PARSERS = {KIND_KEYWORDS: parse_keywords, KIND_LOCATIONS: parse_locations}
+
+
+class ConfigCache:
+    """Parsed config lists cached by source path, revalidated by mtime/size and content hash"""
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = path
+        self.entries = self._load()
+        self.parsed = 0  # Sources that had to be parsed again (for reporting)
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache.get("entries", {}) if cache.get("version") == CACHE_VERSION else {}
+
+    def _save(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "entries": self.entries}, f, ensure_ascii=False)
+        os.replace(temp_path, self.path)
+
+    def load(self, source_path, kind):
+        """Returns the parsed list for a source file, parsing it only when its content changed"""
+        stat = os.stat(source_path)
+        key = f"{kind}:{os.path.abspath(source_path)}"
+        entry = self.entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry["data"]
+
+        digest = _file_sha256(source_path)
+        if entry is None or entry["sha256"] != digest:
+            entry = {"sha256": digest, "data": _PARSERS[kind](source_path)}
+            self.parsed += 1
+        entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        self.entries[key] = entry
+        try:
+            self._save()
+        except OSError:
+            pass  # Read-only working directory: still works, just without the cache
+        return entry["data"]
+
+
+def load_sweep_config(keywords_path=KEYWORDS_PATH, locations_path=LOCATIONS_PATH, cache_path=CACHE_PATH):
+    """Returns (search_queries, locations), from the cache whenever the sources are unchanged"""
+    cache = ConfigCache(cache_path)
+    return cache.load(keywords_path, KIND_KEYWORDS), cache.load(locations_path, KIND_LOCATIONS)
@@ -0,0 +1,65 @@
+import re
+
+import pandas as pd
+from pandas.api.types import is_object_dtype, is_string_dtype
+
+# Excel-safe text cleaning.
+#
+# openpyxl refuses strings containing ASCII/C1 control characters, so every text
+# cell has to be stripped of them before a sheet is written.
+
+# Control characters Excel cannot store, as a regex (for finding) and a translation table (for removing)
+CONTROL_CHARS_PATTERN = r'[\x00-\x1F\x7F-\x9F]'
+CONTROL_CHARS_TABLE = str.maketrans("", "", "".join(chr(c) for c in [*range(0x00, 0x20), *range(0x7F, 0xA0)]))
+VECTORIZE_MIN_ROWS = 500  # Below this, per-cell cleaning beats the fixed cost of pandas string ops
+
+
+# Function to clean text fields to remove illegal characters
+def clean_text(text):
+    """Removes illegal characters that Excel cannot handle."""
+    if isinstance(text, str):
+        return re.sub(CONTROL_CHARS_PATTERN, '', text)  # Removes control characters
+    return text
+
+
+def _clean_series_small(series):
+    """Per-cell translate for short columns, where vectorized calls cost more than they save"""
+    values = series.tolist()
+    cleaned = [value.translate(CONTROL_CHARS_TABLE) if isinstance(value, str) else value for value in values]
+    changed = sum(1 for old, new in zip(values, cleaned) if isinstance(old, str) and len(old) != len(new))
+    return cleaned, changed
+
+
+def clean_dataframe(df):
+    """
+    Removes illegal characters from the text columns of a DataFrame in vectorized passes.
+    Numeric columns are skipped entirely and only cells that contain control characters are rewritten.
+    Returns the cleaned DataFrame and the number of cells that were changed.
+    """
+    changed_cells = 0
+    vectorize = len(df) >= VECTORIZE_MIN_ROWS
+
+    for column, dtype in df.dtypes.items():
+        if not (is_object_dtype(dtype) or is_string_dtype(dtype)):
+            continue  # Numeric columns can't hold control characters
+
+        series = df[column]
+        if not vectorize:
+            cleaned, dirty_count = _clean_series_small(series)
+            if dirty_count:
+                df[column] = pd.Series(cleaned, index=series.index, dtype=dtype)
+                changed_cells += dirty_count
+            continue
+
+        try:
+            dirty = series.str.contains(CONTROL_CHARS_PATTERN, regex=True, na=False)
+        except AttributeError:
+            # Object column without any strings in it; fall back to the per-cell cleaner
+            df[column] = series.map(clean_text)
+            continue
+
+        dirty_count = int(dirty.sum())
+        if dirty_count:
+            df.loc[dirty, column] = series[dirty].str.translate(CONTROL_CHARS_TABLE)
+            changed_cells += dirty_count
+    return df, changed_cells
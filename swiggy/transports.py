@@ -0,0 +1,143 @@
+import threading
+
+from . import browserPool
+from . import dishExtractor
+from . import httpClient
+from . import rateLimiter
+
+# Pluggable ways of loading a search/v3 URL as parsed JSON.
+#
+# Both scripts run the same engine (URL building, DISH card extraction, dedup
+# and output in swiggy.pipeline); only the transport differs:
+#   http     the pooled requests session, paced by the adaptive rate limiter
+#   browser  headless Chrome from the browser worker pool (lightweight by default)
+#   tiered   http first, the browser only for URLs http could not serve
+# A transport is any object with fetch(url) -> parsed JSON or None, summary()
+# -> a report line or None, and close(); HTTP-backed ones also expose the
+# rate_limiter they pace with, which SwiggyClient reports on.
+
+TRANSPORT_HTTP = "http"
+TRANSPORT_BROWSER = "browser"
+TRANSPORT_TIERED = "tiered"
+
+TIERED_HTTP_MAX_RETRIES = 1  # Retries on 429/5xx before a URL falls through to the browser
+
+
+class HttpTransport:
+    """GETs URLs through the shared keep-alive session and the rate limiter"""
+
+    def __init__(self, rate_limiter=None, headers=None, max_retries=rateLimiter.MAX_RETRIES):
+        self.rate_limiter = rate_limiter or rateLimiter.AdaptiveRateLimiter()
+        self.headers = httpClient.REQUEST_HEADERS if headers is None else headers
+        self.max_retries = max_retries
+
+    def fetch(self, url):
+        response = rateLimiter.request_with_backoff(
+            self.rate_limiter, lambda: httpClient.get(url, headers=self.headers), max_retries=self.max_retries)
+        if response is None:
+            return None  # Connection kept failing
+        if response.status_code != 200:
+            print(f"❌ Failed to fetch {url} (Status code: {response.status_code})")
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            print(f"❌ Response for {url} is not JSON")  # e.g. a bot-check page
+            return None
+
+    def summary(self):
+        return None  # Connection and throttling stats are reported by SwiggyClient
+
+    def close(self):
+        pass
+
+
+class BrowserTransport:
+    """Loads URLs as pages in the headless browser worker pool (started on first use)"""
+
+    def __init__(self, pool_factory=browserPool.BrowserWorkerPool):
+        self.pool_factory = pool_factory
+        self.pool = None
+        self._lock = threading.Lock()
+
+    def fetch(self, url):
+        if self.pool is None:
+            with self._lock:
+                if self.pool is None:
+                    self.pool = self.pool_factory()
+        return self.pool.submit(url).result()
+
+    def summary(self):
+        if self.pool is None:
+            return None
+        stats = self.pool.stats
+        return f"🌐 {stats['pages']} pages with {stats['drivers_started']} browsers ({stats['recycled']} recycled, {stats['crashes']} crashes)"
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+
+
+class TieredTransport:
+    """Tries plain HTTP first and falls back to the browser only for URLs it could not load as a search result; records the tier per URL"""
+
+    def __init__(self, http=None, browser=None):
+        self.http = http or HttpTransport(max_retries=TIERED_HTTP_MAX_RETRIES)
+        self.browser = browser or BrowserTransport()
+        self.tiers = {}  # url -> TRANSPORT_HTTP, TRANSPORT_BROWSER or None (failed on both)
+        self._lock = threading.Lock()
+        self.stats = {TRANSPORT_HTTP: 0, TRANSPORT_BROWSER: 0, "failed": 0}
+
+    @property
+    def rate_limiter(self):
+        return self.http.rate_limiter
+
+    def _record(self, url, tier):
+        with self._lock:
+            self.tiers[url] = tier
+            self.stats[tier or "failed"] += 1
+
+    def fetch(self, url):
+        data = self.http.fetch(url)
+        if dishExtractor.is_search_result(data):
+            self._record(url, TRANSPORT_HTTP)
+            return data
+        # Failed, or an error/blocked payload: Chrome only starts on the first URL that needs it
+        data = self.browser.fetch(url)
+        self._record(url, TRANSPORT_BROWSER if dishExtractor.is_search_result(data) else None)
+        return data
+
+    def summary(self):
+        stats = self.stats
+        line = f"⚡ {stats[TRANSPORT_HTTP]} over HTTP, 🌐 {stats[TRANSPORT_BROWSER]} via browser, ❌ {stats['failed']} failed"
+        browser_summary = self.browser.summary()
+        return f"{line}\n{browser_summary}" if browser_summary else line
+
+    def close(self):
+        self.http.close()
+        self.browser.close()
+
+
+def create_transport(name=TRANSPORT_HTTP, rate_limiter=None, browser_workers=browserPool.DEFAULT_WORKERS,
+                     pages_per_driver=browserPool.PAGES_PER_DRIVER, lightweight=True):
+    """
+    Builds the transport called name ("http", "browser" or "tiered").
+
+    lightweight browsers skip images, CSS and fonts and read the JSON from the
+    DevTools network log instead of the rendered page.
+    """
+
+    def pool_factory():
+        if lightweight:
+            return browserPool.BrowserWorkerPool(workers=browser_workers, pages_per_driver=pages_per_driver,
+                                                 driver_factory=browserPool.create_lightweight_driver,
+                                                 fetch_page=browserPool.read_cdp_json)
+        return browserPool.BrowserWorkerPool(workers=browser_workers, pages_per_driver=pages_per_driver)
+
+    if name == TRANSPORT_HTTP:
+        return HttpTransport(rate_limiter)
+    if name == TRANSPORT_BROWSER:
+        return BrowserTransport(pool_factory)
+    if name == TRANSPORT_TIERED:
+        return TieredTransport(HttpTransport(rate_limiter, max_retries=TIERED_HTTP_MAX_RETRIES), BrowserTransport(pool_factory))
+    raise ValueError(f"Unknown transport: {name}")
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+
+# Background upload of a run's output files.
+#
+# The sweep is the producer: every finished artifact (a keyword's Parquet/Arrow
+# file, the workbook, ...) is submitted as soon as it is on disk, and a worker
+# thread uploads it while later keywords are still being fetched. close() waits
+# for the queue to drain; the manifest is written once, after every upload has
+# either succeeded or failed, so it always describes exactly what reached Drive.
+
+MANIFEST_VERSION = 1
+
+
+def file_sha256(file_path, block_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BackgroundUploader:
+    """
+    Uploads submitted files on a worker thread, in submission order.
+
+    upload_fn(file_path, name) uploads one file and returns its remote ID. A
+    single worker is used because a Drive client (httplib2) must not be shared
+    between threads.
+    """
+
+    def __init__(self, upload_fn):
+        self.upload_fn = upload_fn
+        self.entries = []  # Manifest entries, in submission order
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="uploader", daemon=True)
+        self._worker.start()
+
+    def submit(self, file_path, name=None):
+        """Queues a finished file for upload; name is the remote file name (default: the base name)"""
+        if self._closed:
+            raise RuntimeError("BackgroundUploader is closed")
+        entry = {
+            "name": name or os.path.basename(file_path),
+            "path": file_path,
+            "status": "queued",
+        }
+        with self._lock:
+            self.entries.append(entry)
+        self._queue.put(entry)
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                return
+            self._upload(entry)
+
+    def _upload(self, entry):
+        started = time.monotonic()
+        try:
+            entry["bytes"] = os.path.getsize(entry["path"])
+            entry["sha256"] = file_sha256(entry["path"])
+            entry["file_id"] = self.upload_fn(entry["path"], entry["name"])
+            entry["status"] = "uploaded"
+            print(f"☁️ Uploaded {entry['name']} (File ID: {entry['file_id']})")
+        except Exception as e:  # Recorded in the manifest; one failed file must not stop the others
+            entry["status"] = "failed"
+            entry["error"] = f"{type(e).__name__}: {e}"
+            print(f"❌ Upload failed for {entry['name']}: {entry['error']}")
+        entry["seconds"] = round(time.monotonic() - started, 3)
+
+    def close(self):
+        """Waits until every submitted file is uploaded (or failed); returns the entries"""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._worker.join()
+        return self.entries
+
+    def summary(self):
+        with self._lock:
+            statuses = [entry["status"] for entry in self.entries]
+        return {status: statuses.count(status) for status in ("uploaded", "failed", "queued")}
+
+    def write_manifest(self, manifest_path, **run_info):
+        """
+        Writes the run manifest (after close()): run_info plus one entry per file.
+
+        The file is written to a temporary name and renamed into place, so a
+        reader never sees a half-written manifest.
+        """
+        entries = self.close()
+        manifest = {
+            "version": MANIFEST_VERSION,
+            **run_info,
+            "complete": all(entry["status"] == "uploaded" for entry in entries),
+            "files": entries,
+        }
+        temp_path = manifest_path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, manifest_path)
+        return manifest
@@ -0,0 +1,73 @@
+import html
+import json
+import re
+import threading
+
+import pytest
+import requests
+
+from swiggy import stubServer
+
+
+def dish_card(name, restaurant, price=10000, locality="Kondapur", total_ratings="1.2K+"):
+    """One DISH card as search/v3 returns it"""
+    return {"card": {"card": {
+        "info": {"name": name, "price": price, "category": "Snacks", "ratings": {"aggregatedRating": {"rating": "4.2"}}},
+        "restaurant": {"info": {"id": f"id-{restaurant}-{locality}", "name": restaurant, "locality": locality,
+                                "areaName": "Hitech City", "totalRatingsString": total_ratings, "cuisines": ["Snacks"]}},
+    }}}
+
+
+def search_response(*cards):
+    """A search/v3 response whose first groupedCard holds the given DISH cards"""
+    return {"statusCode": 0, "data": {"cards": [{"card": {}}, {"groupedCard": {"cardGroupMap": {"DISH": {"cards": list(cards)}}}}]}}
+
+
+@pytest.fixture
+def stub_swiggy(tmp_path):
+    """Starts a stub Swiggy server; returns (base URL, recordings dir) where "<query>.json" files are served"""
+    responses_dir = tmp_path / "recorded_responses"
+    responses_dir.mkdir()
+    server = stubServer.make_server(str(responses_dir))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", responses_dir
+    server.shutdown()
+    server.server_close()
+
+
+def record(responses_dir, query, response):
+    (responses_dir / f"{query}.json").write_text(json.dumps(response), encoding="utf-8")
+
+
+class HttpDriver:
+    """Stands in for a Chrome driver: loads pages over HTTP and reads the <pre> text"""
+
+    def __init__(self):
+        self.page = ""
+        self.quit_called = False
+
+    def get(self, url):
+        self.page = requests.get(url, timeout=5).text
+
+    def find_element(self, by, value):
+        match = re.search(r"<pre>(.*)</pre>", self.page, re.S)
+        if match is None:
+            raise ValueError("no <pre> on the page")
+        element = type("Element", (), {})()
+        element.text = html.unescape(match.group(1))
+        return element
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def html_stub(tmp_path):
+    """Starts a stub server that wraps the JSON in <pre> like a browser page; returns (search URL, recordings dir)"""
+    responses_dir = tmp_path / "recorded_pages"
+    responses_dir.mkdir()
+    server = stubServer.make_server(str(responses_dir), html=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}{stubServer.SEARCH_PATH}", responses_dir
+    server.shutdown()
+    server.server_close()
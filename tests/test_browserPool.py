@@ -0,0 +1,135 @@
+import base64
+import json
+
+import pytest
+
+from conftest import HttpDriver, dish_card, record, search_response
+from swiggy import browserPool
+
+
+def test_pool_returns_pages_in_order_and_recycles(html_stub):
+    search_url, responses_dir = html_stub
+    queries = [f"q{i}" for i in range(7)]
+    for query in queries:
+        record(responses_dir, query, search_response(dish_card(f"{query} dish", "Place")))
+
+    drivers = []
+
+    slots = set()
+
+    def driver_factory(slot):
+        slots.add(slot)
+        drivers.append(HttpDriver())
+        return drivers[-1]
+
+    with browserPool.BrowserWorkerPool(workers=3, pages_per_driver=2, driver_factory=driver_factory) as pool:
+        results = list(pool.imap(f"{search_url}?str={query}" for query in queries))
+
+    names = [data["data"]["cards"][1]["groupedCard"]["cardGroupMap"]["DISH"]["cards"][0]["card"]["card"]["info"]["name"]
+             for _, data in results]
+    assert names == [f"{query} dish" for query in queries]
+    assert pool.stats["pages"] == 7
+    assert pool.stats["recycled"] >= 2
+    assert all(driver.quit_called for driver in drivers)
+    assert slots <= {0, 1, 2}
+
+
+def test_crashed_driver_is_replaced_and_url_retried(html_stub):
+    search_url, responses_dir = html_stub
+    record(responses_dir, "q", search_response(dish_card("Dish", "Place")))
+    crashes = [1]
+
+    class CrashingDriver(HttpDriver):
+        def get(self, url):
+            if crashes[0]:
+                crashes[0] -= 1
+                raise RuntimeError("chrome not reachable")
+            super().get(url)
+
+    with browserPool.BrowserWorkerPool(workers=1, driver_factory=lambda slot: CrashingDriver()) as pool:
+        [data] = pool.map([f"{search_url}?str=q"])
+
+    assert data is not None
+    assert pool.stats["crashes"] == 1
+    assert pool.stats["drivers_started"] == 2
+
+
+def test_unreadable_page_gives_none(html_stub):
+    search_url, _ = html_stub
+    with browserPool.BrowserWorkerPool(workers=1, driver_factory=lambda slot: HttpDriver()) as pool:
+        assert pool.map([f"{search_url}?str=missing"]) == [None]  # 404 page without <pre>
+    assert pool.stats["page_errors"] == 1
+
+
+class CdpDriver(HttpDriver):
+    """HttpDriver that also keeps a DevTools performance log and serves Network.getResponseBody"""
+
+    def __init__(self, body=None):
+        super().__init__()
+        self.body = body  # What getResponseBody returns for the page; None raises (evicted)
+        self.log = []
+        self.requested_ids = []
+
+    def get(self, url):
+        super().get(url)
+        self.log = [
+            self._response("1", "Script", url + "&script=1"),  # Subresources are ignored
+            self._response("2", "Document", "http://127.0.0.1/redirected-from"),
+            self._response("3", "Document", url),
+        ]
+
+    @staticmethod
+    def _response(request_id, resource_type, url):
+        message = {"method": "Network.responseReceived",
+                   "params": {"requestId": request_id, "type": resource_type, "response": {"url": url}}}
+        return {"message": json.dumps({"message": message})}
+
+    def get_log(self, log_type):
+        assert log_type == "performance"
+        log, self.log = self.log, []
+        return log
+
+    def execute_cdp_cmd(self, command, params):
+        assert command == "Network.getResponseBody"
+        self.requested_ids.append(params["requestId"])
+        if self.body is None:
+            raise RuntimeError("No resource with given identifier found")
+        return self.body
+
+
+def dish_names(data):
+    return [card["card"]["card"]["info"]["name"]
+            for card in data["data"]["cards"][1]["groupedCard"]["cardGroupMap"]["DISH"]["cards"]]
+
+
+def test_cdp_json_reads_the_document_body(html_stub):
+    search_url, responses_dir = html_stub
+    record(responses_dir, "q", search_response(dish_card("From the page", "Place")))
+    raw = json.dumps(search_response(dish_card("From DevTools", "Place")))
+
+    driver = CdpDriver({"body": raw, "base64Encoded": False})
+    assert dish_names(browserPool.read_cdp_json(driver, f"{search_url}?str=q")) == ["From DevTools"]
+    assert driver.requested_ids == ["3"]  # The Document response for this URL, not the script or the redirect
+
+    encoded = base64.b64encode(raw.encode("utf-8")).decode("ascii")
+    driver = CdpDriver({"body": encoded, "base64Encoded": True})
+    assert dish_names(browserPool.read_cdp_json(driver, f"{search_url}?str=q")) == ["From DevTools"]
+
+
+@pytest.mark.parametrize("body", [None, {"body": "<html>not json</html>", "base64Encoded": False}])
+def test_cdp_json_falls_back_to_the_pre_text(html_stub, body):
+    search_url, responses_dir = html_stub
+    record(responses_dir, "q", search_response(dish_card("From the page", "Place")))
+
+    driver = CdpDriver(body)
+    assert dish_names(browserPool.read_cdp_json(driver, f"{search_url}?str=q")) == ["From the page"]
+
+
+def test_cdp_json_without_a_logged_document_uses_the_pre_text(html_stub):
+    search_url, responses_dir = html_stub
+    record(responses_dir, "q", search_response(dish_card("From the page", "Place")))
+
+    driver = CdpDriver({"body": "{}", "base64Encoded": False})
+    driver.get_log = lambda log_type: []  # Nothing captured (e.g. logging not enabled)
+    assert dish_names(browserPool.read_cdp_json(driver, f"{search_url}?str=q")) == ["From the page"]
+    assert driver.requested_ids == []
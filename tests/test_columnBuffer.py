@@ -0,0 +1,25 @@
+import pandas as pd
+
+from swiggy import columnBuffer
+
+
+def test_dedup_matches_drop_duplicates():
+    first = {"Dish Name": ["a", "b", "a"], "Restaurant Name": ["x", "x", "x"], "Price (₹)": [1.0, 2.0, 3.0]}
+    second = {"Dish Name": ["b", "c", "a"], "Restaurant Name": ["x", "x", "y"], "Price (₹)": [4.0, 5.0, 6.0]}
+    buffer = columnBuffer.DedupBuffer(list(first), {"Price (₹)": "d"}, key_columns=["Dish Name", "Restaurant Name"])
+    buffer.append(first)
+    buffer.append(second)
+
+    expected = pd.concat([pd.DataFrame(first), pd.DataFrame(second)], ignore_index=True)
+    expected = expected.drop_duplicates(subset=["Dish Name", "Restaurant Name"], keep="first", ignore_index=True)
+    pd.testing.assert_frame_equal(buffer.to_frame(), expected)
+    assert buffer.raw_rows == 6
+
+
+def test_distinct_keys_with_equal_hashes_are_both_kept():
+    # hash(-1) == hash(-2) in CPython, so these two keys hash the same
+    assert hash((-1, "x")) == hash((-2, "x"))
+    columns = {"Dish Name": [-1, -2], "Restaurant Name": ["x", "x"]}
+    buffer = columnBuffer.DedupBuffer(list(columns), key_columns=["Dish Name", "Restaurant Name"])
+    buffer.append(columns)
+    assert len(buffer) == 2
@@ -0,0 +1,31 @@
+import pandas as pd
+
+from swiggy import columnWidths
+
+
+def test_same_schema_sheets_are_sized_from_their_own_data():
+    sizer = columnWidths.ColumnWidthSizer()
+    short = pd.DataFrame({"Dish Name": ["Idli"], "Rating": ["4.1"]})
+    long = pd.DataFrame({"Dish Name": ["Paneer Butter Masala with Butter Naan"], "Rating": ["4.1"]})
+
+    assert sizer.widths(short)["A"] == len("Dish Name") + 5  # The header is the longest value
+    assert sizer.widths(long)["A"] == len("Paneer Butter Masala with Butter Naan") + 5
+
+
+def test_widths_skip_missing_values_and_cap_at_excel_limit():
+    df = pd.DataFrame({"Dish Name": ["x" * 300, None], "Rating": [None, "4.1"], "Price": [1.5, None],
+                       "Total Ratings": [1200, 30]})
+    widths = columnWidths.compute_column_widths(df.astype({"Rating": object}))
+
+    assert widths == {"A": columnWidths.MAX_COLUMN_WIDTH, "B": len("Rating") + 5, "C": len("Price") + 5,
+                      "D": len("Total Ratings") * 3}
+
+
+def test_fixed_layout_covers_every_wide_sheet_column():
+    from openpyxl.utils import get_column_letter
+
+    from swiggy import pipeline
+
+    wide_columns = [column for column in pipeline.dish_extractor.columns if column != "Restaurant ID"]
+    assert list(columnWidths.FIXED_COLUMN_WIDTHS) == [get_column_letter(i) for i in range(1, len(wide_columns) + 1)]
+    assert wide_columns.index("Description") == list(columnWidths.FIXED_COLUMN_WIDTHS).index("I")
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+
+from conftest import dish_card, record, search_response
+from swiggy import deltaSnapshot, pipeline
+
+
+def run_delta_sweep(base_url, tmp_path):
+    (tmp_path / "keywords.json").write_text(json.dumps(["Momos"]))
+    (tmp_path / "locations.json").write_text(json.dumps([{"Latitude": "17.48", "Longitude": "78.39"},
+                                                         {"Latitude": "17.44", "Longitude": "78.38"}]))
+    options = pipeline.SweepOptions(keywords_path="keywords.json", locations_path="locations.json", base_url=base_url,
+                                    cache_mode="off", output_mode=pipeline.OUTPUT_MODE_DELTA, record_history=False,
+                                    upload=False, save_path=str(tmp_path / "out"))
+    run = pipeline.SweepRun(options)
+    result = run.run()
+    return run, result
+
+
+def test_delta_keeps_every_outlet_of_a_chain(stub_swiggy, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    base_url, responses_dir = stub_swiggy
+    record(responses_dir, "Momos", search_response(
+        dish_card("Veg Momos", "Momo Hut", locality="Kondapur"),
+        dish_card("Veg Momos", "Momo Hut", locality="Madhapur"),
+    ))
+
+    run, result = run_delta_sweep(base_url, tmp_path)
+    assert result["complete"]
+    snapshot = deltaSnapshot.load_snapshot()
+    assert sorted(snapshot["Locality"]) == ["Kondapur", "Madhapur"]
+    assert run.delta_tracker.summary()["inserts"] == 2
+
+    # Same data again: nothing changed, in particular no insert/delete pair for either outlet
+    run, _ = run_delta_sweep(base_url, tmp_path)
+    summary = run.delta_tracker.summary()
+    assert (summary["inserts"], summary["updates"], summary["deletes"]) == (0, 0, 0)
+
+
+def test_snapshot_is_kept_until_the_delta_tables_are_saved(stub_swiggy, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    base_url, responses_dir = stub_swiggy
+    record(responses_dir, "Momos", search_response(dish_card("Veg Momos", "Momo Hut")))
+
+    def failing_save(self):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(pipeline.SweepRun, "save_outputs", failing_save)
+        with pytest.raises(OSError):
+            run_delta_sweep(base_url, tmp_path)
+    assert deltaSnapshot.load_snapshot() is None
+
+    # The rerun resumes from the journal and still reports the insert the failed run never saved
+    run, _ = run_delta_sweep(base_url, tmp_path)
+    assert run.delta_tracker.summary()["inserts"] == 1
+    assert len(deltaSnapshot.load_snapshot()) == 1
@@ -0,0 +1,45 @@
+import random
+
+import pandas as pd
+import pytest
+
+from swiggy import dishExtractor
+
+
+def random_rating_string(rng):
+    """Random totalRatingsString-like values, including the odd formats the scalar parser accepts"""
+    number = rng.choice([str(rng.randint(0, 999)), f"{rng.randint(1, 99)}.{rng.randint(0, 9)}", str(rng.randint(1, 50))])
+    suffix = rng.choice(["", "K", "k", "M", "m", "K+", "M+", "+", " ratings"])
+    value = rng.choice(["", " "]) + number + suffix + rng.choice(["", " ", "+"])
+    return rng.choice([value, value, value, "", "N/A", "New", None, 42])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_ratings_series_matches_scalar(seed):
+    """convert_total_ratings_series gives exactly what convert_total_ratings gives per value"""
+    rng = random.Random(seed)
+    ratings = pd.Series([random_rating_string(rng) for _ in range(5000)], dtype=object)
+    expected = [dishExtractor.convert_total_ratings(value) for value in ratings]
+    actual = dishExtractor.convert_total_ratings_series(ratings).tolist()
+    assert actual == expected
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_ratings_values_match_scalar(seed):
+    """convert_total_ratings_values (the buffer-column converter) agrees with convert_total_ratings"""
+    rng = random.Random(seed)
+    ratings = [random_rating_string(rng) for _ in range(5000)]
+    expected = [dishExtractor.convert_total_ratings(value) for value in ratings]
+    assert dishExtractor.convert_total_ratings_values(ratings).tolist() == expected
+
+
+def test_ratings_series_keeps_index_and_name():
+    ratings = pd.Series(["1.3K+", "N/A", "1.3K+"], index=[5, 7, 9], name="Total Ratings", dtype=object)
+    converted = dishExtractor.convert_total_ratings_series(ratings)
+    assert converted.tolist() == [1300, dishExtractor.convert_total_ratings("N/A"), 1300]
+    assert converted.index.tolist() == [5, 7, 9]
+    assert converted.name == "Total Ratings"
+
+
+def test_ratings_series_empty():
+    assert dishExtractor.convert_total_ratings_series(pd.Series([], dtype=object)).tolist() == []
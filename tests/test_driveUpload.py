@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from swiggy import driveUpload, fakeDriveServer  # noqa: E402
+
+
+@pytest.fixture
+def fake_drive(tmp_path, monkeypatch):
+    """Starts a fake Drive endpoint that fails every 2nd chunk; returns (endpoint, uploads dir)"""
+    monkeypatch.setattr(driveUpload.rateLimiter, "backoff_delay", lambda attempt: 0.0)  # No waiting between retries
+    uploads_dir = tmp_path / "fake_drive"
+    server, endpoint = fakeDriveServer.serve_in_background(str(uploads_dir), fail_every=2)
+    yield endpoint, uploads_dir
+    server.shutdown()
+    server.server_close()
+
+
+def test_resumable_upload_survives_failed_chunks(tmp_path, fake_drive):
+    endpoint, uploads_dir = fake_drive
+    source = tmp_path / "SwiggyData-test.xlsx"
+    payload = os.urandom(3 * driveUpload.CHUNK_ALIGNMENT + 1234)
+    source.write_bytes(payload)
+
+    progress = []
+    service = driveUpload.get_drive_service(api_endpoint=endpoint)
+    file_id = driveUpload.upload_file(str(source), "folder", chunk_size=driveUpload.CHUNK_ALIGNMENT, service=service,
+                                      progress=lambda name, uploaded, total: progress.append((uploaded, total)))
+
+    assert file_id.startswith("fake-")
+    assert (uploads_dir / source.name).read_bytes() == payload
+    assert progress[-1] == (len(payload), len(payload))
+    assert [uploaded for uploaded, _ in progress] == sorted(uploaded for uploaded, _ in progress)
+
+
+def test_nested_names_keep_their_layout(tmp_path, fake_drive):
+    endpoint, uploads_dir = fake_drive
+    source = tmp_path / "part-0.parquet"
+    source.write_bytes(b"parquet bytes")
+
+    service = driveUpload.get_drive_service(api_endpoint=endpoint)
+    driveUpload.upload_file(str(source), "folder", service=service, progress=None, name="parquet/run=1/part-0.parquet")
+    assert (uploads_dir / "parquet" / "run=1" / "part-0.parquet").read_bytes() == b"parquet bytes"
+
+
+def test_aligned_chunk_size():
+    assert driveUpload.aligned_chunk_size(1) == driveUpload.CHUNK_ALIGNMENT
+    assert driveUpload.aligned_chunk_size(driveUpload.CHUNK_ALIGNMENT) == driveUpload.CHUNK_ALIGNMENT
+    assert driveUpload.aligned_chunk_size(driveUpload.CHUNK_ALIGNMENT + 1) == 2 * driveUpload.CHUNK_ALIGNMENT
+
+
+def test_milestone_progress_prints_each_step_once(capsys):
+    report = driveUpload.milestone_progress(step=50)
+    for uploaded in (10, 20, 60, 70, 100):
+        report("file.xlsx", uploaded, 100)
+    lines = capsys.readouterr().out.splitlines()
+    assert [line.rsplit("(", 1)[1] for line in lines] == ["10%)", "60%)", "100%)"]
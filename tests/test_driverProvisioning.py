@@ -0,0 +1,113 @@
+import datetime
+import json
+
+import pytest
+
+from swiggy import driverProvisioning
+
+
+class FakeInstaller:
+    """Stands in for webdriver_manager: returns result (or raises it) and counts the installs"""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = 0
+
+    def __call__(self):
+        if isinstance(self.result, Exception):
+            raise self.result
+        self.calls += 1
+        return self.result
+
+
+@pytest.fixture
+def provisioning(tmp_path, monkeypatch):
+    """Fresh process state, a cache file under tmp_path and a fake installer; returns (cache path, installer)"""
+    monkeypatch.delenv("SWIGGY_CHROMEDRIVER", raising=False)
+    monkeypatch.setattr(driverProvisioning, "_driver_path", None)
+    installer = FakeInstaller(str(driver_file(tmp_path, "new")))
+    monkeypatch.setattr(driverProvisioning, "_install_driver", installer)
+    return str(tmp_path / "chromedriver.json"), installer
+
+
+def driver_file(tmp_path, name):
+    path = tmp_path / f"chromedriver-{name}"
+    path.write_text("")
+    return path
+
+
+def write_cache(cache_path, driver_path, age_days):
+    resolved_at = datetime.datetime.now() - datetime.timedelta(days=age_days)
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"driver_path": str(driver_path), "resolved_at": resolved_at.isoformat(timespec="seconds")}, f)
+
+
+def read_cache(cache_path):
+    with open(cache_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def reset(monkeypatch):
+    monkeypatch.setattr(driverProvisioning, "_driver_path", None)  # As if in a new process
+
+
+def test_first_run_installs_and_caches(provisioning, tmp_path, monkeypatch):
+    cache_path, installer = provisioning
+    assert driverProvisioning.resolve_driver_path(cache_path) == installer.result
+    assert installer.calls == 1
+    assert read_cache(cache_path)["driver_path"] == installer.result
+
+    # Kept for the rest of the process, and offline from the cache in the next one
+    assert driverProvisioning.resolve_driver_path(cache_path) == installer.result
+    reset(monkeypatch)
+    assert driverProvisioning.resolve_driver_path(cache_path) == installer.result
+    assert installer.calls == 1
+
+
+def test_fresh_cache_is_used_without_installing(provisioning, tmp_path):
+    cache_path, installer = provisioning
+    cached = driver_file(tmp_path, "cached")
+    write_cache(cache_path, cached, age_days=1)
+    assert driverProvisioning.resolve_driver_path(cache_path) == str(cached)
+    assert installer.calls == 0
+
+
+def test_stale_or_missing_driver_is_refreshed(provisioning, tmp_path, monkeypatch):
+    cache_path, installer = provisioning
+    write_cache(cache_path, driver_file(tmp_path, "old"), age_days=driverProvisioning.REFRESH_AFTER_DAYS + 1)
+    assert driverProvisioning.resolve_driver_path(cache_path) == installer.result
+
+    reset(monkeypatch)
+    write_cache(cache_path, tmp_path / "deleted-driver", age_days=1)  # Cached path no longer exists
+    assert driverProvisioning.resolve_driver_path(cache_path) == installer.result
+    assert installer.calls == 2
+
+
+def test_refresh_reinstalls_even_when_fresh(provisioning, tmp_path):
+    cache_path, installer = provisioning
+    write_cache(cache_path, driver_file(tmp_path, "cached"), age_days=0)
+    assert driverProvisioning.resolve_driver_path(cache_path, refresh=True) == installer.result
+    assert installer.calls == 1
+    assert read_cache(cache_path)["driver_path"] == installer.result
+
+
+def test_offline_refresh_falls_back_to_the_cached_driver(provisioning, tmp_path):
+    cache_path, installer = provisioning
+    cached = driver_file(tmp_path, "cached")
+    write_cache(cache_path, cached, age_days=driverProvisioning.REFRESH_AFTER_DAYS + 1)
+    installer.result = ConnectionError("offline")
+    assert driverProvisioning.resolve_driver_path(cache_path) == str(cached)
+
+
+def test_offline_without_a_cache_raises(provisioning):
+    cache_path, installer = provisioning
+    installer.result = ConnectionError("offline")
+    with pytest.raises(ConnectionError):
+        driverProvisioning.resolve_driver_path(cache_path)
+
+
+def test_explicit_driver_wins(provisioning, monkeypatch):
+    cache_path, installer = provisioning
+    monkeypatch.setenv("SWIGGY_CHROMEDRIVER", "/opt/chromedriver")
+    assert driverProvisioning.resolve_driver_path(cache_path, refresh=True) == "/opt/chromedriver"
+    assert installer.calls == 0
@@ -0,0 +1,57 @@
+import threading
+import time
+
+from conftest import dish_card, record, search_response
+from swiggy import fetchEngine, pipeline
+
+LOCATIONS = [{"Latitude": "17.48", "Longitude": "78.39"}, {"Latitude": "17.44", "Longitude": "78.38"}]
+
+
+def test_sweep_against_stub_server(stub_swiggy):
+    base_url, responses_dir = stub_swiggy
+    record(responses_dir, "Momos", search_response(dish_card("Veg Momos", "Momo Hut"), dish_card("Corn Momos", "Momo Hut")))
+    record(responses_dir, "Fries", search_response(dish_card("Peri Peri Fries", "Fry Co")))
+
+    client = pipeline.SwiggyClient(base_url, max_concurrency=4)
+    results = list(fetchEngine.sweep(["Momos", "Fries"], LOCATIONS, client.fetch, pipeline.parse,
+                                     max_concurrency=4, accumulator_factory=pipeline.new_query_buffer))
+    client.close()
+
+    assert [query for query, _ in results] == ["Momos", "Fries"]
+    momos, fries = (pipeline.to_frame(buffer) for _, buffer in results)
+    # Both locations return the same dishes; only the first occurrence is kept
+    assert momos["Dish Name"].tolist() == ["Veg Momos", "Corn Momos"]
+    assert momos["Total Ratings"].tolist() == [1200, 1200]
+    assert fries["Dish Name"].tolist() == ["Peri Peri Fries"]
+    assert results[0][1].raw_rows == 4
+
+
+def test_sweep_yields_in_order_and_runs_concurrently():
+    lock = threading.Lock()
+    in_flight = [0, 0]  # current, peak
+
+    def fetch(lat, lng, query):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight[1], in_flight[0])
+        time.sleep(0.05 if query == "slow" else 0.01)
+        with lock:
+            in_flight[0] -= 1
+        return search_response(dish_card(f"{query} dish", f"{query} at {lat}"))
+
+    queries = ["slow", "b", "c", "d"]
+    results = list(fetchEngine.sweep(queries, LOCATIONS, fetch, pipeline.parse, max_concurrency=4))
+
+    assert [query for query, _ in results] == queries
+    assert all(len(rows) == len(LOCATIONS) for _, rows in results)
+    assert 1 < in_flight[1] <= 4
+
+
+def test_failed_fetch_is_skipped():
+    def fetch(lat, lng, query):
+        if lat == LOCATIONS[0]["Latitude"]:
+            raise ConnectionError("boom")
+        return search_response(dish_card("Dish", "Place"))
+
+    [(query, rows)] = list(fetchEngine.sweep(["q"], LOCATIONS, fetch, pipeline.parse))
+    assert len(rows) == 1
@@ -0,0 +1,42 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import dish_card, record, search_response
+from swiggy import httpClient, stubServer
+
+
+def test_sequential_requests_reuse_one_connection(stub_swiggy):
+    base_url, responses_dir = stub_swiggy
+    record(responses_dir, "default", search_response(dish_card("Veg Momos", "Momo Hut")))
+    host = httpClient.host_of(base_url)
+    session = httpClient.create_session({host: 4})
+    try:
+        for i in range(5):
+            assert session.get(f"{base_url}{stubServer.SEARCH_PATH}?str=q{i}", timeout=5).status_code == 200
+        stats = httpClient.connection_stats(session)
+    finally:
+        session.close()
+
+    assert stats["hosts"] == {"127.0.0.1": {"requests": 5, "connections": 1, "reused": 4}}
+    assert (stats["requests"], stats["connections"], stats["reuse_ratio"]) == (5, 1, 0.8)
+
+
+def test_host_pool_size_bounds_the_connections(stub_swiggy):
+    base_url, responses_dir = stub_swiggy
+    record(responses_dir, "default", search_response(dish_card("Veg Momos", "Momo Hut")))
+    session = httpClient.create_session({httpClient.host_of(base_url): 2})
+    try:
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            statuses = list(executor.map(
+                lambda i: session.get(f"{base_url}{stubServer.SEARCH_PATH}?str=q{i}", timeout=5).status_code, range(24)))
+        stats = httpClient.connection_stats(session)
+    finally:
+        session.close()
+
+    assert statuses == [200] * 24
+    assert stats["requests"] == 24
+    assert 1 <= stats["connections"] <= 2  # Blocking pool: threads wait for a pooled connection
+
+
+def test_no_session_means_no_stats(monkeypatch):
+    monkeypatch.setattr(httpClient, "_session", None)
+    assert httpClient.connection_stats() == {"hosts": {}, "requests": 0, "connections": 0, "reuse_ratio": 0.0}
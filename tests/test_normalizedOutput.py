@@ -0,0 +1,26 @@
+import json
+
+from conftest import dish_card, record, search_response
+from swiggy import pipeline
+
+
+def test_normalized_keeps_every_outlet_of_a_chain(stub_swiggy, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    base_url, responses_dir = stub_swiggy
+    record(responses_dir, "Momos", search_response(
+        dish_card("Veg Momos", "Momo Hut", locality="Kondapur"),
+        dish_card("Veg Momos", "Momo Hut", locality="Madhapur"),
+    ))
+    (tmp_path / "keywords.json").write_text(json.dumps(["Momos"]))
+    (tmp_path / "locations.json").write_text(json.dumps([{"Latitude": "17.48", "Longitude": "78.39"},
+                                                         {"Latitude": "17.44", "Longitude": "78.38"}]))
+    options = pipeline.SweepOptions(keywords_path="keywords.json", locations_path="locations.json", base_url=base_url,
+                                    cache_mode="off", output_mode=pipeline.OUTPUT_MODE_NORMALIZED, record_history=False,
+                                    upload=False, save_path=str(tmp_path / "out"))
+    run = pipeline.SweepRun(options)
+    assert run.run()["complete"]
+
+    tables = run.normalized_tables.tables()
+    assert sorted(tables["Restaurants"]["Restaurant ID"]) == ["id-Momo Hut-Kondapur", "id-Momo Hut-Madhapur"]
+    assert sorted(tables["Dishes"]["Restaurant ID"]) == ["id-Momo Hut-Kondapur", "id-Momo Hut-Madhapur"]
+    assert len(tables["Keyword Matches"]) == 2
@@ -0,0 +1,60 @@
+import datetime
+import json
+
+import pandas as pd
+import pytest
+
+from conftest import dish_card, record, search_response
+from swiggy import pipeline, priceHistory
+
+pytest.importorskip("pyarrow")
+
+
+def keyword_table(price, restaurant="Momo Hut", dish="Veg Momos"):
+    return pd.DataFrame({"Dish Name": [dish], "Restaurant Name": [restaurant], "Locality": ["Kondapur"],
+                         "Price (₹)": [price], "Rating": ["4.2"], "Total Ratings": ["1.2K+"]})
+
+
+def test_ingest_is_idempotent_per_run(tmp_path):
+    store = priceHistory.HistoryStore(str(tmp_path / "history"))
+    observed_at = datetime.datetime(2025, 3, 7, 18, 49, 4)
+
+    assert store.ingest_tables({"Momos": keyword_table(120.0)}, observed_at) == 1
+    assert store.ingest_tables({"Momos": keyword_table(999.0)}, observed_at) == 0  # Same run: nothing appended
+    assert store.query()["Price (₹)"].tolist() == [120.0]
+
+
+def test_price_history_over_a_date_range(tmp_path):
+    store = priceHistory.HistoryStore(str(tmp_path / "history"))
+    for day, price in ((1, 100.0), (2, 110.0), (5, 130.0)):
+        store.ingest_tables({"Momos": keyword_table(price), "Fries": keyword_table(90.0, "Burger Barn", "Fries")},
+                            datetime.datetime(2025, 3, day, 12, 0, 0))
+
+    history = store.price_history("Veg Momos", "Momo Hut", "2025-03-02", "2025-03-05")
+    assert history["Price (₹)"].tolist() == [110.0, 130.0]  # A bare end date covers that whole day
+    assert history["Total Ratings"].tolist() == [1200, 1200]
+    assert list(history.columns) == priceHistory.HISTORY_VIEW_COLUMNS
+    assert store.price_history("Veg Momos", "Momo Hut", "2025-03-06").empty
+
+
+def test_history_is_recorded_once_the_sweep_is_saved(stub_swiggy, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    base_url, responses_dir = stub_swiggy
+    record(responses_dir, "Momos", search_response(dish_card("Veg Momos", "Momo Hut")))
+    (tmp_path / "keywords.json").write_text(json.dumps(["Momos", "Fries"]))
+    (tmp_path / "locations.json").write_text(json.dumps([{"Latitude": "17.48", "Longitude": "78.39"}]))
+
+    def sweep():
+        options = pipeline.SweepOptions(keywords_path="keywords.json", locations_path="locations.json",
+                                        base_url=base_url, cache_mode="off", upload=False,
+                                        save_path=str(tmp_path / "out"))
+        return pipeline.SweepRun(options).run()
+
+    # "Fries" has no recording (404), so the sweep is incomplete and nothing is recorded yet
+    assert not sweep()["complete"]
+    assert priceHistory.HistoryStore().query().empty
+
+    # The rerun replays the journaled "Momos" rows and records them exactly once
+    record(responses_dir, "Fries", search_response(dish_card("Fries", "Burger Barn")))
+    assert sweep()["complete"]
+    assert sorted(priceHistory.HistoryStore().query()["Dish Name"]) == ["Fries", "Veg Momos"]
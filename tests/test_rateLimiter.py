@@ -0,0 +1,147 @@
+import datetime
+import email.utils
+
+import pytest
+import requests
+
+from swiggy import rateLimiter
+
+
+class FakeClock:
+    """Stands in for the time module inside rateLimiter; sleep() only advances the clock"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rateLimiter, "time", clock)
+    monkeypatch.setattr(rateLimiter.random, "uniform", lambda low, high: high)  # Deterministic backoff
+    return clock
+
+
+def sender(*outcomes):
+    """send() that returns (or raises) the given outcomes in order"""
+    outcomes = list(outcomes)
+    calls = []
+
+    def send():
+        calls.append(1)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    send.calls = calls
+    return send
+
+
+def test_parse_retry_after(clock):
+    assert rateLimiter.parse_retry_after("120") == 120.0
+    assert rateLimiter.parse_retry_after(" 1.5 ") == 1.5
+    assert rateLimiter.parse_retry_after("-3") == 0.0
+    assert rateLimiter.parse_retry_after(None) is None
+    assert rateLimiter.parse_retry_after("soon") is None
+
+    retry_at = datetime.datetime.fromtimestamp(clock.now + 30, tz=datetime.timezone.utc)
+    assert rateLimiter.parse_retry_after(email.utils.format_datetime(retry_at, usegmt=True)) == pytest.approx(30.0)
+    past = datetime.datetime.fromtimestamp(clock.now - 30, tz=datetime.timezone.utc)
+    assert rateLimiter.parse_retry_after(email.utils.format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_token_bucket_allows_a_burst_then_paces(clock):
+    limiter = rateLimiter.AdaptiveRateLimiter(rate=2.0, burst=3)
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+    limiter.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]  # One token every 1/rate seconds
+
+
+def test_retry_after_pauses_every_request(clock):
+    limiter = rateLimiter.AdaptiveRateLimiter(rate=10.0, burst=5)
+    limiter.record_error(retry_after=4.0)
+    limiter.acquire()
+    assert sum(clock.sleeps) == pytest.approx(4.0)
+
+
+def test_errors_halve_the_rate_and_a_clean_window_raises_it(clock):
+    limiter = rateLimiter.AdaptiveRateLimiter(rate=4.0, min_rate=0.5, max_rate=4.5, window=10, increase_step=0.25)
+    for _ in range(4):
+        limiter.record_error()
+    assert limiter.rate == 2.0  # Decreased once the window had seen enough requests
+
+    for _ in range(10):
+        limiter.record_error()
+    assert limiter.rate == 0.5  # Never below min_rate
+
+    for _ in range(9):
+        limiter.record_success()
+    assert limiter.rate == 0.5  # An error is still in the window
+    for _ in range(21):
+        limiter.record_success()
+    assert limiter.rate == 1.25  # One step per clean window of 10
+    assert limiter.stats() == {"rate": 1.25, "successes": 30, "errors": 14}
+
+    for _ in range(200):
+        limiter.record_success()
+    assert limiter.rate == 4.5  # Never above max_rate
+
+
+def test_request_with_backoff_retries_throttled_responses(clock):
+    limiter = rateLimiter.AdaptiveRateLimiter(rate=100.0)
+    send = sender(FakeResponse(429, {"Retry-After": "7"}), FakeResponse(503), FakeResponse(200))
+
+    response = rateLimiter.request_with_backoff(limiter, send, max_retries=5)
+    assert response.status_code == 200
+    assert len(send.calls) == 3
+    assert clock.sleeps[0] == 7.0  # Retry-After beats the first backoff (1 s)
+    assert clock.sleeps[1] == 2.0  # Then the full-jitter backoff for the second attempt
+    assert limiter.stats()["errors"] == 2 and limiter.stats()["successes"] == 1
+
+
+def test_request_with_backoff_gives_up_with_the_last_response(clock):
+    limiter = rateLimiter.AdaptiveRateLimiter(rate=100.0)
+    send = sender(FakeResponse(500), FakeResponse(502), FakeResponse(504))
+
+    response = rateLimiter.request_with_backoff(limiter, send, max_retries=2)
+    assert response.status_code == 504
+    assert len(send.calls) == 3
+
+
+def test_request_with_backoff_returns_other_statuses_untouched(clock):
+    limiter = rateLimiter.AdaptiveRateLimiter(rate=100.0)
+    send = sender(FakeResponse(404))
+    assert rateLimiter.request_with_backoff(limiter, send).status_code == 404
+    assert len(send.calls) == 1
+    assert limiter.stats()["successes"] == 1
+
+
+def test_request_with_backoff_returns_none_when_the_connection_keeps_failing(clock):
+    limiter = rateLimiter.AdaptiveRateLimiter(rate=100.0)
+    send = sender(requests.ConnectionError("refused"), requests.Timeout("slow"), FakeResponse(200))
+    assert rateLimiter.request_with_backoff(limiter, send, max_retries=2).status_code == 200
+
+    send = sender(requests.ConnectionError("refused"), requests.Timeout("slow"))
+    assert rateLimiter.request_with_backoff(limiter, send, max_retries=1) is None
+    assert len(send.calls) == 2
@@ -0,0 +1,93 @@
+import pytest
+
+from swiggy import responseCache
+
+
+class FakeTime:
+    """Stands in for the time module inside responseCache"""
+    now = 1_000_000.0
+
+    @classmethod
+    def time(cls):
+        return cls.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    monkeypatch.setattr(responseCache, "time", FakeTime)
+    FakeTime.now = 1_000_000.0
+    return FakeTime
+
+
+def response(text):
+    return {"statusCode": 0, "data": {"text": text}}
+
+
+def test_stale_entries_are_refetched_but_still_replayed_offline(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite")
+    cache = responseCache.ResponseCache(path, ttl_seconds=60)
+    cache.put("17.48", "78.39", "Momos", response("old"))
+    assert cache.get(" 17.480000", "78.39", "  momos ") == response("old")  # Normalized key
+
+    clock.now += 61
+    assert cache.get("17.48", "78.39", "Momos") is None  # Stale: fetched again in readwrite mode
+    cache.put("17.48", "78.39", "Fries", response("new"))  # A later online run stores something else
+    cache.close()
+
+    offline = responseCache.ResponseCache(path, ttl_seconds=60, mode=responseCache.MODE_OFFLINE)
+    assert offline.get("17.48", "78.39", "Momos") == response("old")  # However old it is
+    assert offline.stats()["entries"] == 2
+    offline.close()
+
+
+def test_size_pressure_evicts_stale_entries_first_then_least_recently_used(tmp_path, clock):
+    path = str(tmp_path / "cache.sqlite")
+    cache = responseCache.ResponseCache(path, ttl_seconds=60)
+    for query in ("a", "b", "c"):
+        cache.put("1", "2", query, response(query * 50))
+        clock.now += 1
+    entry_size = cache.stats()["bytes"] // 3
+
+    clock.now += 60  # a, b and c are stale now
+    cache.put("1", "2", "d", response("d" * 50))
+    clock.now += 1
+    cache.put("1", "2", "e", response("e" * 50))
+    clock.now += 1
+    cache.get("1", "2", "d")  # d is now more recently used than e
+    cache.close()
+
+    # Room for three entries: all stale ones go (oldest first), the fresh ones stay
+    cache = responseCache.ResponseCache(path, ttl_seconds=60, max_bytes=entry_size * 3 + 10)
+    cache.put("1", "2", "f", response("f" * 50))
+    assert stored_queries(cache) == ["d", "e", "f"]
+
+    # No stale entries left: the least recently used fresh one (e) goes next
+    clock.now += 1
+    cache.put("1", "2", "g", response("g" * 50))
+    assert stored_queries(cache) == ["d", "f", "g"]
+    assert cache.stats()["bytes"] == sum_of_sizes(cache)
+    cache.close()
+
+
+def test_replacing_an_entry_keeps_the_running_total(tmp_path, clock):
+    cache = responseCache.ResponseCache(str(tmp_path / "cache.sqlite"))
+    cache.put("1", "2", "a", response("short"))
+    cache.put("1", "2", "a", response("a much longer body than before"))
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["bytes"] == sum_of_sizes(cache)
+    cache.close()
+
+
+def test_off_mode_stores_nothing(tmp_path):
+    cache = responseCache.ResponseCache(str(tmp_path / "cache.sqlite"), mode=responseCache.MODE_OFF)
+    cache.put("1", "2", "a", response("a"))
+    assert cache.get("1", "2", "a") is None
+    assert not (tmp_path / "cache.sqlite").exists()
+
+
+def stored_queries(cache):
+    return sorted(row[0] for row in cache._conn.execute("SELECT query FROM responses"))
+
+
+def sum_of_sizes(cache):
+    return cache._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
@@ -0,0 +1,52 @@
+import json
+
+from conftest import dish_card, search_response
+from swiggy import dishExtractor, fetchEngine, pipeline, sweepCheckpoint
+
+LOCATIONS = [{"Latitude": "17.48", "Longitude": "78.39"}]
+
+
+def open_checkpoint(path):
+    return sweepCheckpoint.SweepCheckpoint(str(path), dishExtractor.DISH_COLUMN_TYPES, columns=pipeline.dish_extractor.columns)
+
+
+def test_malformed_payload_is_not_journaled(tmp_path):
+    responses = {
+        "blocked": {"statusCode": 1, "data": None},
+        "empty": search_response(),
+        "found": search_response(dish_card("Veg Momos", "Momo Hut")),
+    }
+    checkpoint = open_checkpoint(tmp_path / "checkpoint.jsonl")
+    list(fetchEngine.sweep(list(responses), LOCATIONS, lambda lat, lng, query: responses[query], pipeline.parse,
+                           checkpoint=checkpoint))
+
+    assert not checkpoint.is_done("blocked", "17.48", "78.39")  # Retried next run
+    assert checkpoint.is_done("empty", "17.48", "78.39")  # Genuinely no dishes
+    assert checkpoint.is_done("found", "17.48", "78.39")
+    assert not checkpoint.is_complete(list(responses), LOCATIONS)
+    checkpoint.close()
+
+
+def test_resume_reuses_journaled_rows(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    checkpoint = open_checkpoint(path)
+    list(fetchEngine.sweep(["q"], LOCATIONS, lambda lat, lng, query: search_response(dish_card("Dish", "Place")),
+                           pipeline.parse, checkpoint=checkpoint))
+    checkpoint.close()
+
+    def fetch_fails(lat, lng, query):
+        raise AssertionError("journaled pair fetched again")
+
+    resumed = open_checkpoint(path)
+    [(_, rows)] = list(fetchEngine.sweep(["q"], LOCATIONS, fetch_fails, pipeline.parse, checkpoint=resumed))
+    assert rows[0].columns["Dish Name"] == ["Dish"]
+    resumed.finish()
+    assert not path.exists()
+
+
+def test_entries_with_other_columns_are_refetched(tmp_path):
+    path = tmp_path / "checkpoint.jsonl"
+    path.write_text(json.dumps({"query": "q", "lat": "17.48", "lng": "78.39", "columns": {"Dish Name": ["Old"]}}) + "\n")
+    checkpoint = open_checkpoint(path)
+    assert not checkpoint.is_done("q", "17.48", "78.39")
+    checkpoint.close()
@@ -0,0 +1,17 @@
+from swiggy import sweepConfig
+
+
+def test_yaml_config(tmp_path):
+    keywords = tmp_path / "keywords.yaml"
+    keywords.write_text("keywords:\n  - Veg Momos\n  - French Fries\n", encoding="utf-8")
+    locations = tmp_path / "locations.yaml"
+    locations.write_text("locations:\n  - {Latitude: '17.48', Longitude: '78.39'}\n", encoding="utf-8")
+
+    assert sweepConfig.parse_keywords(str(keywords)) == ["Veg Momos", "French Fries"]
+    assert sweepConfig.parse_locations(str(locations)) == [{"Latitude": "17.48", "Longitude": "78.39"}]
+
+
+def test_csv_config(tmp_path):
+    keywords = tmp_path / "keywords.csv"
+    keywords.write_text("Veg Momos\nFrench Fries\n\n", encoding="utf-8")
+    assert sweepConfig.parse_keywords(str(keywords)) == ["Veg Momos", "French Fries"]
@@ -0,0 +1,42 @@
+from conftest import HttpDriver, dish_card, record, search_response
+from swiggy import browserPool, stubServer, transports
+
+BLOCKED = {"statusCode": 1, "data": None}
+
+
+def test_tiered_falls_back_to_the_browser_for_failed_or_blocked_http(stub_swiggy, html_stub):
+    base_url, responses_dir = stub_swiggy
+    page_url, pages_dir = html_stub
+    record(responses_dir, "Momos", search_response(dish_card("Veg Momos", "Momo Hut")))
+    record(responses_dir, "Blocked", BLOCKED)
+    for query in ("Blocked", "Missing"):  # "Missing" has no HTTP recording at all (404)
+        record(pages_dir, query, search_response(dish_card(f"{query} dish", "Place")))
+    record(pages_dir, "Nowhere", BLOCKED)
+
+    class BrowserDriver(HttpDriver):
+        """Loads the same URL from the HTML stub, as a browser that gets past the block would"""
+
+        def get(self, url):
+            super().get(url.replace(base_url + stubServer.SEARCH_PATH, page_url))
+
+    def pool_factory():
+        return browserPool.BrowserWorkerPool(workers=1, driver_factory=lambda slot: BrowserDriver())
+
+    transport = transports.TieredTransport(transports.HttpTransport(max_retries=0),
+                                           transports.BrowserTransport(pool_factory))
+    urls = {query: f"{base_url}{stubServer.SEARCH_PATH}?str={query}" for query in ("Momos", "Blocked", "Missing", "Nowhere")}
+    try:
+        results = {query: transport.fetch(url) for query, url in urls.items()}
+    finally:
+        transport.close()
+
+    assert results["Blocked"]["data"]["cards"][1]["groupedCard"]["cardGroupMap"]["DISH"]["cards"][0]["card"]["card"]["info"]["name"] == "Blocked dish"
+    assert results["Missing"] is not None
+    assert {query: transport.tiers[url] for query, url in urls.items()} == {
+        "Momos": transports.TRANSPORT_HTTP,
+        "Blocked": transports.TRANSPORT_BROWSER,
+        "Missing": transports.TRANSPORT_BROWSER,
+        "Nowhere": None,  # Blocked on both tiers
+    }
+    assert transport.stats == {transports.TRANSPORT_HTTP: 1, transports.TRANSPORT_BROWSER: 2, "failed": 1}
+    assert transport.browser.pool.stats["pages"] == 3